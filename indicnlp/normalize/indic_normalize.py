@@ -13,9 +13,45 @@
 # @author Anoop Kunchukuttan 
 #
 
-import sys, codecs, string, itertools, re
+import sys, codecs, re
+from collections import namedtuple
+from functools import lru_cache
 from indicnlp import langinfo
 
+def _init_char_probe(chars):
+    """
+    Compiles a character class of `chars`, the characters rewritten by a normalization step. 
+    The step can only change text in which a search for this class succeeds. 
+    """
+    return re.compile('[{}]'.format(re.escape(''.join(chars))))
+
+def _init_translate_probe(table):
+    """
+    Compiles a character class of the characters rewritten by `table` (a `str.maketrans` table).
+    Translating can only change text in which a search for this class succeeds, and the
+    search is much cheaper than translate for text outside the Latin-1 range.
+    """
+    return _init_char_probe(map(chr,table))
+
+def _replace_found_chars(text,probe,maps):
+    """
+    Rewrites the characters of `text` matched by `probe`, a character class of the keys of `maps`, 
+    with one str.replace per distinct character found. Lines have few of these characters, and 
+    str.translate with a dict table maps every character of the line in Python, so this is much 
+    cheaper. The replacements in `maps` must not contain any of its keys. 
+    """
+    for c in set(probe.findall(text)):
+        text=text.replace(c,maps[c])
+    return text
+
+def _init_literal_alternation(maps):
+    """
+    Compiles an alternation of the literal keys of `maps`, longest keys first. The match at any 
+    position is then the longest applicable key, as with an Aho-Corasick automaton, and all the 
+    rules are applied in a single pass with `pat.sub(lambda m: maps[m.group(0)],text)`. 
+    """
+    return re.compile('|'.join(map(re.escape,sorted(maps,key=len,reverse=True))))
+
 
 class NormalizerI(object):
     """
@@ -72,6 +108,228 @@ class NormalizerI(object):
     def normalize(self,text):
         pass 
 
+    def normalize_batch(self,texts):
+        """
+        Normalizes each string in `texts`, returns a list of the normalized strings. 
+        The normalize method is looked up once for the whole batch 
+        """
+        normalize=self.normalize
+        return [normalize(text) for text in texts]
+
+
+_NormalizerState=namedtuple('_NormalizerState',[
+        'native_to_hindu_numerals_translator',
+        'hindu_numerals_to_native_translator',
+        'native_numerals_probe',
+        'hindu_numerals_probe',
+        'chandra_substitutions',
+        'pats_repls',
+        'nasals_probe',
+        'vowel_ending_pat_repl',
+    ])
+
+def _init_normalize_numerals(lang):
+    native_to_hindu_numerals_map={}
+    hindu_numerals_to_native_map={}
+    for i in range(10):
+        native_digit=langinfo.offset_to_char(langinfo.NUMERIC_OFFSET_START+i,lang)
+        native_to_hindu_numerals_map[native_digit]=str(i)
+        hindu_numerals_to_native_map[str(i)]=native_digit
+    return (str.maketrans(native_to_hindu_numerals_map),
+            str.maketrans(hindu_numerals_to_native_map))
+
+# (source, target) offsets of the chandra substitutions
+_CHANDRA_SUBSTITUTION_OFFSETS=(
+    (0x0d , 0x0f), # chandra e, independent
+    (0x11 , 0x13), # chandra o, independent
+    (0x45 , 0x47), # chandra e , 0xde],pendent
+    (0x49 , 0x4b), # chandra o , 0xde],pendent
+    # (0x72 , 0x0f), # mr: chandra e, independent
+
+    (0x00 , 0x02), # chandrabindu
+    (0x01 , 0x02), # chandrabindu
+)
+
+def _init_normalize_chandras(lang):
+    return tuple( 
+            (langinfo.offset_to_char(x[0],lang), langinfo.offset_to_char(x[1],lang)) 
+                for x in _CHANDRA_SUBSTITUTION_OFFSETS )
+
+def _init_normalize_vowel_ending(lang):
+    """
+    Pattern matching a word (space separated) ending in a consonant, along with the 
+    replacement which adds the halant (IE) or the 'a' ki maatra (Dravidian) to it
+    """
+
+    if lang in langinfo.IE_LANGUAGES:
+        suffix=langinfo.offset_to_char(langinfo.HALANTA_OFFSET,lang)
+    elif lang in langinfo.DRAVIDIAN_LANGUAGES:
+        suffix=langinfo.offset_to_char(0x3e,lang)
+    else:
+        return None
+
+    pat=re.compile(r'([{start_r}-{end_r}])(?= |\Z)'.format(
+            start_r=langinfo.offset_to_char(0x15,lang),
+            end_r=langinfo.offset_to_char(0x39,lang),
+        ))
+
+    return (pat,'\\1'+suffix)
+
+# (nasal, first consonant, last consonant) offsets of the consonant groups 
+# and the nasal homorganic to each group
+_NASAL_SIGNATURES=(
+    (0x19,0x15,0x18),
+    (0x1e,0x1a,0x1d),
+    (0x23,0x1f,0x22),
+    (0x28,0x24,0x27),
+    (0x29,0x24,0x27),
+    (0x2e,0x2a,0x2d),
+)
+
+_HALANT_OFFSET=0x4d
+_ANUSVAARA_OFFSET=0x02
+
+@lru_cache(maxsize=None)
+def _nasal_chars(lang):
+    """
+    Returns the characters for `_NASAL_SIGNATURES` in the script of `lang`, along with the 
+    halant and anusvaara characters 
+    """
+    nasal_chars=tuple(
+        tuple(langinfo.offset_to_char(offset,lang) for offset in pat_signature)
+        for pat_signature in _NASAL_SIGNATURES
+    )
+    return (nasal_chars,
+            langinfo.offset_to_char(_HALANT_OFFSET,lang),
+            langinfo.offset_to_char(_ANUSVAARA_OFFSET,lang))
+
+def _init_to_anusvaara_strict(lang):
+    """
+    `r1_nasal=re.compile(r'\\u0919\\u094D([\\u0915-\\u0918])')`
+    """
+
+    nasal_chars,halant,anusvaara=_nasal_chars(lang)
+
+    # single pattern with one alternative per nasal, the lookahead leaves 
+    # the following consonant in place
+    pat=re.compile('|'.join(
+        r'{nasal}{halant}(?=[{start_r}-{end_r}])'.format(
+            nasal=nasal,
+            halant=halant,
+            start_r=start_r,
+            end_r=end_r,
+        )
+        for nasal,start_r,end_r in nasal_chars
+    ))
+    
+    repl_string=anusvaara
+
+    return (pat,repl_string)
+
+def _init_to_anusvaara_relaxed(lang):
+    """
+    `r1_nasal=re.compile(r'\\u0919\\u094D([\\u0915-\\u0918])')`
+    """
+        
+    nasal_chars,halant,anusvaara=_nasal_chars(lang)
+    nasals_list_str=','.join([nasal for nasal,_,_ in nasal_chars])
+    
+    pat=re.compile(r'[{nasals_list_str}]{halant}'.format(
+            nasals_list_str=nasals_list_str,
+            halant=halant,
+        ))
+    
+    repl_string=anusvaara
+
+    return (pat,repl_string)
+
+def _init_to_nasal_consonants(lang):
+    """
+    `r1_nasal=re.compile(r'\\u0919\\u094D([\\u0915-\\u0918])')`
+    """
+
+    nasal_chars,halant,anusvaara=_nasal_chars(lang)
+
+    # single pattern for anusvaara followed by any of the consonants, and
+    # a lookup from the matched text to the nasal consonant replacement
+    char_ranges=[]
+    repls={}
+    
+    for nasal,start_r,end_r in nasal_chars:
+        char_ranges.append('{start_r}-{end_r}'.format(
+            start_r=start_r,
+            end_r=end_r,
+        ))
+        for codepoint in range(ord(start_r),ord(end_r)+1):
+            consonant=chr(codepoint)
+            # the first nasal listed for a consonant range takes precedence
+            repls.setdefault(anusvaara+consonant, nasal+halant+consonant)
+
+    pat=re.compile('{anusvaara}[{char_ranges}]'.format(
+        anusvaara=anusvaara,
+        char_ranges=''.join(char_ranges),
+    ))
+
+    return (pat,repls)
+
+def _init_nasals_probe(lang,nasals_mode):
+    """
+    Character class of the characters which can start a match of the nasal pattern 
+    for `nasals_mode`, used to skip the substitution when none of them occurs. 
+    Returns None if the mode does no substitution. 
+    """
+    nasal_chars,halant,anusvaara=_nasal_chars(lang)
+
+    if nasals_mode in ('to_anusvaara_strict','to_anusvaara_relaxed'):
+        # same character list as the relaxed pattern (commas included)
+        probe_chars=','.join([nasal for nasal,_,_ in nasal_chars])
+    elif nasals_mode == 'to_nasal_consonants':
+        probe_chars=anusvaara
+    else:
+        return None
+
+    return re.compile('[{}]'.format(probe_chars))
+
+@lru_cache(maxsize=None)
+def _build_state(lang,nasals_mode):
+    """
+    Builds the numeral translators, chandra substitutions and nasal patterns for a language. 
+    These depend only on the language and the nasals mode, so they are computed once
+    and shared by all normalizers with the same configuration. 
+    """
+    native_to_hindu_numerals_translator,hindu_numerals_to_native_translator=_init_normalize_numerals(lang)
+    chandra_substitutions=_init_normalize_chandras(lang)
+
+    pats_repls=None
+    if nasals_mode == 'to_anusvaara_strict':
+        pats_repls=_init_to_anusvaara_strict(lang)
+    elif nasals_mode == 'to_anusvaara_relaxed':
+        pats_repls=_init_to_anusvaara_relaxed(lang)
+    elif nasals_mode == 'to_nasal_consonants':
+        pats_repls=_init_to_nasal_consonants(lang)
+
+    return _NormalizerState(
+        native_to_hindu_numerals_translator=native_to_hindu_numerals_translator,
+        hindu_numerals_to_native_translator=hindu_numerals_to_native_translator,
+        native_numerals_probe=_init_translate_probe(native_to_hindu_numerals_translator),
+        hindu_numerals_probe=_init_translate_probe(hindu_numerals_to_native_translator),
+        chandra_substitutions=chandra_substitutions,
+        pats_repls=pats_repls,
+        nasals_probe=_init_nasals_probe(lang,nasals_mode),
+        vowel_ending_pat_repl=_init_normalize_vowel_ending(lang),
+    )
+
+
+def _init_nukta_tables(nukta,nukta_composites):
+    """
+    Builds the decomposition map with its probe, and the recomposition map for the nukta 
+    based composite characters of a script. `nukta_composites` maps each composite 
+    character to its base consonant. 
+    """
+    decompose_maps={c: base+nukta for c, base in nukta_composites.items()}
+    recompose_maps={base+nukta: c for c, base in nukta_composites.items()}
+    return (decompose_maps,_init_char_probe(decompose_maps),recompose_maps)
+
 
 class BaseNormalizer(NormalizerI):
 
@@ -96,209 +354,67 @@ class BaseNormalizer(NormalizerI):
         self.do_colon_to_visarga=do_colon_to_visarga
         # TODO: Make visarga correction generic
         
-        self._init_normalize_chandras()
-        self._init_normalize_nasals()
-        self._init_normalize_vowel_ending()
-        self._init_normalize_numerals()
+        self._init_normalize_state()
         #self._init_visarga_correction()
     
-    def _init_normalize_numerals(self):
-        native_to_hindu_numerals_map={}
-        hindu_numerals_to_native_map={}
-        for i in range(10):
-            native_digit=langinfo.offset_to_char(langinfo.NUMERIC_OFFSET_START+i,self.lang)
-            native_to_hindu_numerals_map[native_digit]=str(i)
-            hindu_numerals_to_native_map[str(i)]=native_digit
-        self.native_to_hindu_numerals_translator=str.maketrans(native_to_hindu_numerals_map)
-        self.hindu_numerals_to_native_translator=str.maketrans(hindu_numerals_to_native_map)
+    def _init_normalize_state(self):
+        state=_build_state(self.lang,self.nasals_mode)
+        self.native_to_hindu_numerals_translator=state.native_to_hindu_numerals_translator
+        self.hindu_numerals_to_native_translator=state.hindu_numerals_to_native_translator
+        self.native_numerals_probe=state.native_numerals_probe
+        self.hindu_numerals_probe=state.hindu_numerals_probe
+        self.chandra_substitutions=state.chandra_substitutions
+        self.vowel_ending_pat_repl=state.vowel_ending_pat_repl
+        self.nasals_probe=state.nasals_probe
+        if state.pats_repls is not None:
+            self.pats_repls=state.pats_repls
+            # the nasals mode is fixed, so the substitution method is picked once here
+            self._to_nasals={
+                'to_anusvaara_strict': self._to_anusvaara_strict,
+                'to_anusvaara_relaxed': self._to_anusvaara_relaxed,
+                'to_nasal_consonants': self._to_nasal_consonants,
+            }[self.nasals_mode]
         
-    def _init_normalize_vowel_ending(self):
-
-        if self.lang in langinfo.IE_LANGUAGES:
-            self.fn_vowel_ending=self._normalize_word_vowel_ending_ie
-        elif self.lang in langinfo.DRAVIDIAN_LANGUAGES:
-            self.fn_vowel_ending=self._normalize_word_vowel_ending_dravidian
-        else:
-            self.fn_vowel_ending=lambda x: x
-
-    def _init_normalize_chandras(self):
-
-        substitution_offsets =\
-            [
-                [0x0d , 0x0f], # chandra e, independent
-                [0x11 , 0x13], # chandra o, independent
-                [0x45 , 0x47], # chandra e , 0xde],pendent
-                [0x49 , 0x4b], # chandra o , 0xde],pendent
-                # [0x72 , 0x0f], # mr: chandra e, independent
-
-                [0x00 , 0x02], # chandrabindu
-                [0x01 , 0x02], # chandrabindu
-            ]
-
-        self.chandra_substitutions =  [ 
-                (langinfo.offset_to_char(x[0],self.lang), langinfo.offset_to_char(x[1],self.lang)) 
-                    for x in substitution_offsets ]
-
     def _normalize_chandras(self,text):
         for match, repl in self.chandra_substitutions:
             text=text.replace(match,repl)
         return text
 
-    def _init_to_anusvaara_strict(self):
-        """
-        `r1_nasal=re.compile(r'\\u0919\\u094D([\\u0915-\\u0918])')`
-        """
-    
-        pat_signatures=\
-            [
-                 [0x19,0x15,0x18],
-                 [0x1e,0x1a,0x1d],            
-                 [0x23,0x1f,0x22],                        
-                 [0x28,0x24,0x27],        
-                 [0x29,0x24,0x27],                    
-                 [0x2e,0x2a,0x2d],                    
-            ]    
-        
-        halant_offset=0x4d
-        anusvaara_offset=0x02
-        
-        pats=[]
-        
-        for pat_signature in pat_signatures:
-            pat=re.compile(r'{nasal}{halant}([{start_r}-{end_r}])'.format(
-                nasal=langinfo.offset_to_char(pat_signature[0],self.lang),
-                halant=langinfo.offset_to_char(halant_offset,self.lang),
-                start_r=langinfo.offset_to_char(pat_signature[1],self.lang),
-                end_r=langinfo.offset_to_char(pat_signature[2],self.lang),
-            ))
-            pats.append(pat)
-        
-        repl_string='{anusvaara}\\1'.format(anusvaara=langinfo.offset_to_char(anusvaara_offset,self.lang))
-
-        self.pats_repls=(pats,repl_string)
-    
     def _to_anusvaara_strict(self,text):
-        
-        pats, repl_string = self.pats_repls
-        for pat in pats:
-            text=pat.sub(repl_string,text)
-            
-        return text
-
-    def _init_to_anusvaara_relaxed(self):
-        """
-        `r1_nasal=re.compile(r'\\u0919\\u094D([\\u0915-\\u0918])')`
-        """
-            
-        nasals_list=[0x19,0x1e,0x23,0x28,0x29,0x2e]    
-        nasals_list_str=','.join([langinfo.offset_to_char(x,self.lang) for x in nasals_list])
-        
-        halant_offset=0x4d    
-        anusvaara_offset=0x02    
-        
-        pat=re.compile(r'[{nasals_list_str}]{halant}'.format(
-                nasals_list_str=nasals_list_str,
-                halant=langinfo.offset_to_char(halant_offset,self.lang),
-            ))
-        
-        repl_string='{anusvaara}'.format(anusvaara=langinfo.offset_to_char(anusvaara_offset,self.lang))
+        pat, repl_string = self.pats_repls
+        return pat.sub(repl_string,text)
 
-        self.pats_repls = (pat,repl_string)
-    
     def _to_anusvaara_relaxed(self,text):
         pat, repl_string = self.pats_repls
         return pat.sub(repl_string,text)
     
 
-    def _init_to_nasal_consonants(self):
-        """
-        `r1_nasal=re.compile(r'\\u0919\\u094D([\\u0915-\\u0918])')`
-        """
-    
-        pat_signatures=\
-            [
-                 [0x19,0x15,0x18],
-                 [0x1e,0x1a,0x1d],            
-                 [0x23,0x1f,0x22],                        
-                 [0x28,0x24,0x27],        
-                 [0x29,0x24,0x27],                    
-                 [0x2e,0x2a,0x2d],                    
-            ]    
-        
-        halant_offset=0x4d
-        anusvaara_offset=0x02 
-        
-        pats=[]
-        repl_strings=[]
-        
-        for pat_signature in pat_signatures:
-            pat=re.compile(r'{anusvaara}([{start_r}-{end_r}])'.format(
-                anusvaara=langinfo.offset_to_char(anusvaara_offset,self.lang),
-                start_r=langinfo.offset_to_char(pat_signature[1],self.lang),
-                end_r=langinfo.offset_to_char(pat_signature[2],self.lang),
-            ))
-            pats.append(pat)
-            repl_string='{nasal}{halant}\\1'.format(
-                nasal=langinfo.offset_to_char(pat_signature[0],self.lang),
-                halant=langinfo.offset_to_char(halant_offset,self.lang),
-                )
-            repl_strings.append(repl_string)
-    
-        self.pats_repls=list(zip(pats,repl_strings))
-
     def _to_nasal_consonants(self,text):
-    
-        for pat, repl in self.pats_repls:
-            text=pat.sub(repl,text)
-            
-        return text
-
-    def _init_normalize_nasals(self):
-
-        if self.nasals_mode == 'to_anusvaara_strict':
-            self._init_to_anusvaara_strict()
-        elif self.nasals_mode == 'to_anusvaara_relaxed':
-            self._init_to_anusvaara_relaxed()
-        elif self.nasals_mode == 'to_nasal_consonants':
-            self._init_to_nasal_consonants()
+        pat, repls = self.pats_repls
+        return pat.sub(lambda m: repls[m.group(0)],text)
 
     def _normalize_nasals(self,text): 
-        if self.nasals_mode == 'to_anusvaara_strict':
-            return self._to_anusvaara_strict(text)
-        elif self.nasals_mode == 'to_anusvaara_relaxed':
-            return self._to_anusvaara_relaxed(text)
-        elif self.nasals_mode == 'to_nasal_consonants':
-            return self._to_nasal_consonants(text)
-        else:
+        # one scan for the characters a match has to start with, 
+        # saves the substitution on text without any of them
+        # (there is no probe when the mode does no substitution)
+        if self.nasals_probe is None or not self.nasals_probe.search(text):
             return text
+        return self._to_nasals(text)
 
     
-    def _normalize_word_vowel_ending_dravidian(self,word):
-        """
-        for Dravidian
-        - consonant ending: add 'a' ki maatra
-        - halant ending: no change
-        - 'a' ki maatra: no change
-        """
-        if len(word)>0 and langinfo.is_consonant(word[-1],self.lang):
-            return word+langinfo.offset_to_char(0x3e,self.lang)
-        else:
-            return word
-
-    def _normalize_word_vowel_ending_ie(self,word):
+    def _normalize_vowel_ending(self,text):
         """
         for IE
         - consonant ending: add halant
+        for Dravidian
+        - consonant ending: add 'a' ki maatra
         - halant ending: no change
         - 'a' ki maatra: no change
         """
-        if len(word)>0 and langinfo.is_consonant(word[-1],self.lang):
-            return word+langinfo.offset_to_char(langinfo.HALANTA_OFFSET,self.lang)
-        else:
-            return word 
-
-    def _normalize_vowel_ending(self,text):
-        return ' '.join([ self.fn_vowel_ending(w) for w in text.split(' ') ])
+        if self.vowel_ending_pat_repl is None:
+            return text
+        pat, repl_string = self.vowel_ending_pat_repl
+        return pat.sub(repl_string,text)
 
     def normalize(self,text):
         """
@@ -324,24 +440,26 @@ class BaseNormalizer(NormalizerI):
             text=self._normalize_vowel_ending(text)
         
         if self.do_normalize_numerals:
-            text=text.translate(self.native_to_hindu_numerals_translator)
+            if self.native_numerals_probe.search(text):
+                text=text.translate(self.native_to_hindu_numerals_translator)
         elif self.convert_numerals_to_native:
-            text=text.translate(self.hindu_numerals_to_native_translator)
+            if self.hindu_numerals_probe.search(text):
+                text=text.translate(self.hindu_numerals_to_native_translator)
         
         return text
 
 
     def get_char_stats(self,text):    
-        print(len(re.findall(NormalizerI.BYTE_ORDER_MARK,text)))
-        print(len(re.findall(NormalizerI.BYTE_ORDER_MARK_2,text)))
-        print(len(re.findall(NormalizerI.WORD_JOINER,text)))
-        print(len(re.findall(NormalizerI.SOFT_HYPHEN,text)))
+        print(text.count(NormalizerI.BYTE_ORDER_MARK))
+        print(text.count(NormalizerI.BYTE_ORDER_MARK_2))
+        print(text.count(NormalizerI.WORD_JOINER))
+        print(text.count(NormalizerI.SOFT_HYPHEN))
 
-        print(len(re.findall(NormalizerI.ZERO_WIDTH_SPACE,text) ))
-        print(len(re.findall(NormalizerI.NO_BREAK_SPACE,text)))
+        print(text.count(NormalizerI.ZERO_WIDTH_SPACE))
+        print(text.count(NormalizerI.NO_BREAK_SPACE))
 
-        print(len(re.findall(NormalizerI.ZERO_WIDTH_NON_JOINER,text)))
-        print(len(re.findall(NormalizerI.ZERO_WIDTH_JOINER,text)))
+        print(text.count(NormalizerI.ZERO_WIDTH_NON_JOINER))
+        print(text.count(NormalizerI.ZERO_WIDTH_JOINER))
 
         #for mobj in re.finditer(NormalizerI.ZERO_WIDTH_NON_JOINER,text):
         #    print text[mobj.start()-10:mobj.end()+10].replace('\n', ' ').replace(NormalizerI.ZERO_WIDTH_NON_JOINER,'').encode('utf-8')
@@ -364,6 +482,40 @@ class DevanagariNormalizer(BaseNormalizer):
 
     NUKTA='\u093C' 
 
+    _VISARGA_RE=re.compile(r'([\u0900-\u097f]):')
+    _VISARGA_REPL='\\1\u0903'
+
+    # nukta based composite characters and their base consonants
+    NUKTA_COMPOSITES={
+        '\u0929': '\u0928',
+        '\u0931': '\u0930',
+        '\u0934': '\u0933',
+        '\u0958': '\u0915',
+        '\u0959': '\u0916',
+        '\u095A': '\u0917',
+        '\u095B': '\u091C',
+        '\u095C': '\u0921',
+        '\u095D': '\u0922',
+        '\u095E': '\u092B',
+        '\u095F': '\u092F',
+    }
+    (_NUKTA_DECOMPOSE_MAPS,_NUKTA_DECOMPOSE_PROBE,
+        _NUKTA_RECOMPOSE_MAPS)=_init_nukta_tables(NUKTA,NUKTA_COMPOSITES)
+
+    # nukta removal: drop the nukta and map the nukta based composite
+    # characters to their base consonants
+    _NUKTA_REMOVE_MAPS={NUKTA: '', **NUKTA_COMPOSITES}
+    _NUKTA_REMOVE_PROBE=_init_char_probe(_NUKTA_REMOVE_MAPS)
+
+    TWO_PART_VOWEL_MAPS={
+        '\u093e\u093a':'\u093b', # ा + ऺ ->  ऻ 
+        '\u093e\u0945':'\u0949', # ा + ॅ ->  ॉ 
+        '\u093e\u0946':'\u094a', # ा + ॆ ->  ॊ 
+        '\u093e\u0947':'\u094b', # ा + े ->  ो 
+        '\u093e\u0948':'\u094c', # ा + ै ->  ौ 
+    }
+    _TWO_PART_VOWEL_RE=re.compile('\u093e[\u093a\u0945-\u0948]')
+
     def __init__(self,lang='hi',remove_nuktas=False,decompose_nuktas=False,nasals_mode='do_nothing',
             do_normalize_chandras=False,do_normalize_vowel_ending=False,do_normalize_numerals=False,convert_numerals_to_native=False,do_colon_to_visarga=False,
             do_implosive_consonants_to_germination=False):
@@ -372,11 +524,8 @@ class DevanagariNormalizer(BaseNormalizer):
 
     def _normalize_vowels(self,text):
         # Two-part vowels
-        text=text.replace("\u093e\u093a","\u093b") # ा + ऺ ->  ऻ 
-        text=text.replace("\u093e\u0945","\u0949") # ा + ॅ ->  ॉ 
-        text=text.replace("\u093e\u0946","\u094a") # ा + ॆ ->  ॊ 
-        text=text.replace("\u093e\u0947","\u094b") # ा + े ->  ो 
-        text=text.replace("\u093e\u0948","\u094c") # ा + ै ->  ौ 
+        text=DevanagariNormalizer._TWO_PART_VOWEL_RE.sub(
+                lambda m: DevanagariNormalizer.TWO_PART_VOWEL_MAPS[m.group(0)],text)
 
         if self.do_implosive_consonants_to_germination:
             text=text.replace('\u097b','\u0917\u094d\u0917') # ॻ -> ग्ग 
@@ -396,71 +545,44 @@ class DevanagariNormalizer(BaseNormalizer):
 
         if self.remove_nuktas:
 
-            text=text.replace(DevanagariNormalizer.NUKTA,'')
-            # normalize Nukta based composite characters
-            text=text.replace('\u0929','\u0928')
-            text=text.replace('\u0931','\u0930')
-            text=text.replace('\u0934','\u0933')
-            text=text.replace('\u0958','\u0915')
-            text=text.replace('\u0959','\u0916')
-            text=text.replace('\u095A','\u0917')
-            text=text.replace('\u095B','\u091C')
-            text=text.replace('\u095C','\u0921')
-            text=text.replace('\u095D','\u0922')
-            text=text.replace('\u095E','\u092B')
-            text=text.replace('\u095F','\u092F')
+            # remove nukta and normalize Nukta based composite characters
+            text=_replace_found_chars(text,DevanagariNormalizer._NUKTA_REMOVE_PROBE,
+                    DevanagariNormalizer._NUKTA_REMOVE_MAPS)
         
         else:
             if self.decompose_nuktas:
                 # decomposing Nukta based composite characters
-                text=text.replace('\u0929','\u0928'+DevanagariNormalizer.NUKTA)
-                text=text.replace('\u0931','\u0930'+DevanagariNormalizer.NUKTA)
-                text=text.replace('\u0934','\u0933'+DevanagariNormalizer.NUKTA)
-                text=text.replace('\u0958','\u0915'+DevanagariNormalizer.NUKTA)
-                text=text.replace('\u0959','\u0916'+DevanagariNormalizer.NUKTA)
-                text=text.replace('\u095A','\u0917'+DevanagariNormalizer.NUKTA)
-                text=text.replace('\u095B','\u091C'+DevanagariNormalizer.NUKTA)
-                text=text.replace('\u095C','\u0921'+DevanagariNormalizer.NUKTA)
-                text=text.replace('\u095D','\u0922'+DevanagariNormalizer.NUKTA)
-                text=text.replace('\u095E','\u092B'+DevanagariNormalizer.NUKTA)
-                text=text.replace('\u095F','\u092F'+DevanagariNormalizer.NUKTA)
+                text=_replace_found_chars(text,DevanagariNormalizer._NUKTA_DECOMPOSE_PROBE,
+                        DevanagariNormalizer._NUKTA_DECOMPOSE_MAPS)
             else:
                 # recomposing Nukta based composite characters
                 # Warning: Might increase your vocab size a litte bit
-                text=text.replace('\u0928'+DevanagariNormalizer.NUKTA, '\u0929')
-                text=text.replace('\u0930'+DevanagariNormalizer.NUKTA, '\u0931')
-                text=text.replace('\u0933'+DevanagariNormalizer.NUKTA, '\u0934')
-                text=text.replace('\u0915'+DevanagariNormalizer.NUKTA, '\u0958')
-                text=text.replace('\u0916'+DevanagariNormalizer.NUKTA, '\u0959')
-                text=text.replace('\u0917'+DevanagariNormalizer.NUKTA, '\u095A')
-                text=text.replace('\u091C'+DevanagariNormalizer.NUKTA, '\u095B')
-                text=text.replace('\u0921'+DevanagariNormalizer.NUKTA, '\u095C')
-                text=text.replace('\u0922'+DevanagariNormalizer.NUKTA, '\u095D')
-                text=text.replace('\u092B'+DevanagariNormalizer.NUKTA, '\u095E')
-                text=text.replace('\u092F'+DevanagariNormalizer.NUKTA, '\u095F')
+                if DevanagariNormalizer.NUKTA in text:
+                    for k,v in DevanagariNormalizer._NUKTA_RECOMPOSE_MAPS.items():
+                        text=text.replace(k,v)
 
         # replace pipe character for poorna virama 
         text=text.replace('\u007c','\u0964')
 
-        if self.do_colon_to_visarga: # correct visarga 
-            text=re.sub(r'([\u0900-\u097f]):','\\1\u0903',text)
+        if self.do_colon_to_visarga and ':' in text: # correct visarga 
+            text=self._VISARGA_RE.sub(self._VISARGA_REPL,text)
 
         return text
 
     def get_char_stats(self,text):
         super(DevanagariNormalizer,self).get_char_stats(text)
 
-        print((len(re.findall('\u0929',text))))
-        print((len(re.findall('\u0931',text))))
-        print((len(re.findall('\u0934',text))))
-        print((len(re.findall('\u0958',text))))
-        print((len(re.findall('\u0959',text))))
-        print((len(re.findall('\u095A',text))))
-        print((len(re.findall('\u095B',text))))
-        print((len(re.findall('\u095C',text))))
-        print((len(re.findall('\u095D',text))))
-        print((len(re.findall('\u095E',text))))
-        print((len(re.findall('\u095F',text))))
+        print(text.count('\u0929'))
+        print(text.count('\u0931'))
+        print(text.count('\u0934'))
+        print(text.count('\u0958'))
+        print(text.count('\u0959'))
+        print(text.count('\u095A'))
+        print(text.count('\u095B'))
+        print(text.count('\u095C'))
+        print(text.count('\u095D'))
+        print(text.count('\u095E'))
+        print(text.count('\u095F'))
 
         #print(len(re.findall(u'\u0928'+DevanagariNormalizer.NUKTA,text)))
         #print(len(re.findall(u'\u0930'+DevanagariNormalizer.NUKTA,text)))
@@ -479,6 +601,11 @@ class KashmiriDevanagariNormalizer(DevanagariNormalizer):
     Refer for orthographic changes: https://r12a.github.io/scripts/devanagari/kashmiri#previousOrthographies
     '''
 
+    # Consonant+ऽ
+    _CONSONANT_AVAGRAHA_RE=re.compile("([\u0915-\u0939\u0958-\u095f\u093c])\u093d")
+    # ्व followed by a character outside the ऺ..ॗ sign range
+    _HALANT_VA_RE=re.compile("\u094d\u0935([^\u093a-\u0957])")
+
     def __init__(self,lang='ks_IN',remove_nuktas=False,decompose_nuktas=False,nasals_mode='do_nothing',
             do_normalize_chandras=False,do_normalize_vowel_ending=False,do_normalize_numerals=False,convert_numerals_to_native=False,do_colon_to_visarga=False,
             do_implosive_consonants_to_germination=False,
@@ -493,11 +620,14 @@ class KashmiriDevanagariNormalizer(DevanagariNormalizer):
     
     def _1995_to_2002_orthography(self,text,convert_vowels_with_apostrophe_to_short=False):
         # Dependent vowels
-        text=text.replace("\u0941\u0945","\u0956") # ुॅ ->  ॖ 
-        text=text.replace("\u0945\u0941","\u0956") # ॅु ->  ॖ 
-        text=text.replace("\u0942\u0945","\u0957") # ूॅ ->  ॗ 
-        text=text.replace("\u0945\u0942","\u0957") # ॅू ->  ॗ 
-        text=re.sub("([\u0915-\u0939\u0958-\u095f\u093c])\u093d","\\1\u0945",text) # Consonant+ऽ -> Consonant+ॅ 
+        # (these overlap, eg. ॅुॅ, so their order matters and they are not fused.
+        # all of them need ॅ though)
+        if "\u0945" in text:
+            text=text.replace("\u0941\u0945","\u0956") # ुॅ ->  ॖ 
+            text=text.replace("\u0945\u0941","\u0956") # ॅु ->  ॖ 
+            text=text.replace("\u0942\u0945","\u0957") # ूॅ ->  ॗ 
+            text=text.replace("\u0945\u0942","\u0957") # ॅू ->  ॗ 
+        text=KashmiriDevanagariNormalizer._CONSONANT_AVAGRAHA_RE.sub("\\1\u0945",text) # Consonant+ऽ -> Consonant+ॅ 
         if convert_vowels_with_apostrophe_to_short:
             text=text.replace("\u0947'","\u0946") # े' ->  ॆ 
             text=text.replace("\u094b'","\u094a") # ो' ->  ॊ 
@@ -518,7 +648,7 @@ class KashmiriDevanagariNormalizer(DevanagariNormalizer):
         # Dependent vowels
         text=text.replace("\u0945","\u093a") # ॅ ->  ऺ 
         text=text.replace("\u0949","\u093b") # ॉ ->  ऻ 
-        text=re.sub("\u094d\u0935([^\u093a-\u0957])","\u094f\\1",text) # ्व ->  ॏ 
+        text=KashmiriDevanagariNormalizer._HALANT_VA_RE.sub("\u094f\\1",text) # ्व ->  ॏ 
 
         # Independent vowels
         text=text.replace("\u0972","\u0973") # ॲ -> ॳ 
@@ -543,6 +673,15 @@ class SanskritNormalizer(DevanagariNormalizer):
       - Very time-consuming, recommended to run using multiprocessing
     '''
 
+    # Sandhi-bridge-accent, and all other accent marks
+    _SANDHI_ACCENT_RE=re.compile('[\u0967\u0969][\u0951\u0952]')
+    _ACCENT_RE=re.compile('[\u0951-\u0954\u1cd0-\u1cff\u0971]')
+    _SANDHI_CHUNK_RE=re.compile('[\u0900-\u0963\u0972-\u097f]+')
+
+    # at most this many split chunks are kept in `sandhi_cache`, the oldest are dropped first. 
+    # normalizers from IndicNormalizerFactory live for the whole process, so the cache must not grow without bound
+    SANDHI_CACHE_SIZE=100000
+
     def __init__(self,lang='sa',remove_nuktas=False,decompose_nuktas=False,nasals_mode='do_nothing',
             do_normalize_chandras=False,do_normalize_vowel_ending=False,do_normalize_numerals=False,convert_numerals_to_native=True,do_colon_to_visarga=True,
             do_implosive_consonants_to_germination=False,
@@ -560,33 +699,41 @@ class SanskritNormalizer(DevanagariNormalizer):
                 # Sandhi-splitting implementation is combinatorial-scoring based
                 # So for faster access, better to cache already seen chunks
                 self.sandhi_cache = {}
+
+    def _split_sandhi_chunk(self,chunk):
+        # Ref: https://github.com/kmadathil/sanskrit_parser/blob/master/examples/basic_example.ipynb
+        split_seqs = self.parser.split(chunk, limit=1)
+        if not split_seqs:
+            # print("Unable to find roots for:", chunk)
+            return chunk
+        split_seq = split_seqs[0]
+        splits = [t.transcoded(split_seq.parser.output_encoding, split_seq.parser.strict_io) for t in split_seq.split]
+        return ' '.join(splits)
+
+    def _split_sandhi_chunk_cached(self,chunk):
+        split = self.sandhi_cache.get(chunk)
+        if split is None:
+            if len(self.sandhi_cache) >= SanskritNormalizer.SANDHI_CACHE_SIZE:
+                # dicts keep insertion order, so this is the oldest chunk
+                del self.sandhi_cache[next(iter(self.sandhi_cache))]
+            split = self.sandhi_cache[chunk] = self._split_sandhi_chunk(chunk)
+        return split
     
     def normalize(self,text):
         # common normalization for Devanagari 
         text=super(SanskritNormalizer,self).normalize(text)
-        if self.do_drop_accent:
+        # the sandhi-bridge-accent also contains an accent mark, 
+        # so a text without any accent mark needs neither substitution
+        if self.do_drop_accent and SanskritNormalizer._ACCENT_RE.search(text):
             # Drop Sandhi-bridge-accent
-            text = re.sub('[\u0967\u0969][\u0951\u0952]', '', text)
+            text = SanskritNormalizer._SANDHI_ACCENT_RE.sub('', text)
             # Drop all other remaining accent marks
-            text = re.sub('[\u0951-\u0954\u1cd0-\u1cff\u0971]', '', text)
+            text = SanskritNormalizer._ACCENT_RE.sub('', text)
         
         if self.do_split_sandhi:
-            # Split sentence into parts
-            matches = re.findall('[\u0900-\u0963\u0972-\u097f]+', text)
-            # Sandhi-split for each chunk
-            for match in matches:
-                if match not in self.sandhi_cache:
-                    # Ref: https://github.com/kmadathil/sanskrit_parser/blob/master/examples/basic_example.ipynb
-                    split_seqs = self.parser.split(match, limit=1)
-                    if not split_seqs:
-                        # print("Unable to find roots for:", match)
-                        self.sandhi_cache[match] = match
-                        continue
-                    split_seq = split_seqs[0]
-                    splits = [t.transcoded(split_seq.parser.output_encoding, split_seq.parser.strict_io) for t in split_seq.split]
-                    self.sandhi_cache[match] = ' '.join(splits)
-                
-                text = text.replace(match, self.sandhi_cache[match])
+            # Sandhi-split each chunk of the sentence in a single pass
+            split_chunk = self._split_sandhi_chunk_cached if self.do_cache_sandhi else self._split_sandhi_chunk
+            text = SanskritNormalizer._SANDHI_CHUNK_RE.sub(lambda m: split_chunk(m.group(0)), text)
 
         return text
 
@@ -603,6 +750,26 @@ class GurmukhiNormalizer(BaseNormalizer):
 
     NUKTA='\u0A3C' 
 
+    _VISARGA_RE=re.compile(r'([\u0a00-\u0a7f]):')
+    _VISARGA_REPL='\\1\u0a03'
+
+    # nukta based composite characters and their base consonants
+    NUKTA_COMPOSITES={
+        '\u0a33': '\u0a32',
+        '\u0a36': '\u0a38',
+        '\u0a59': '\u0a16',
+        '\u0a5a': '\u0a17',
+        '\u0a5b': '\u0a1c',
+        '\u0a5e': '\u0a2b',
+    }
+    (_NUKTA_DECOMPOSE_MAPS,_NUKTA_DECOMPOSE_PROBE,
+        _NUKTA_RECOMPOSE_MAPS)=_init_nukta_tables(NUKTA,NUKTA_COMPOSITES)
+
+    # nukta removal: drop the nukta and map the nukta based composite
+    # characters to their base consonants
+    _NUKTA_REMOVE_MAPS={NUKTA: '', **NUKTA_COMPOSITES}
+    _NUKTA_REMOVE_PROBE=_init_char_probe(_NUKTA_REMOVE_MAPS)
+
     VOWEL_NORM_MAPS={
         ## http://www.unicode.org/versions/Unicode12.1.0/ch12.pdf
         ## Table 12-16
@@ -616,6 +783,14 @@ class GurmukhiNormalizer(BaseNormalizer):
         '\u0a73\u0a4b': '\u0a13',
         '\u0a05\u0a4c': '\u0a14',            
     }
+    _VOWEL_NORM_RE=_init_literal_alternation(VOWEL_NORM_MAPS)
+
+    _TIPPI_TO_ADDAK_RE=re.compile('\u0a70([\u0a19\u0a1e\u0a23\u0a28\u0a2e])')
+    _BINDI_TO_TIPPI_RE=re.compile('([\u0a05\u0a07\u0a09\u0a15-\u0a39\u0a3c\u0a3f\u0a41\u0a42\u0a59-\u0a5e])\u0a02')
+    _TIPPI_TO_BINDI_RE=re.compile('([^\u0a05\u0a07\u0a09\u0a15-\u0a39\u0a3c\u0a3f\u0a41\u0a42\u0a59-\u0a5e])\u0a70')
+    _ADDAK_TO_TIPPI_RE=re.compile('\u0a71([\u0a19\u0a1e\u0a23\u0a28\u0a2e])')
+    _ADDAK_RE=re.compile(r'\u0a71(.)')
+    _ADDAK_REPL='\\1\u0a4d\\1'
 
     def __init__(self,lang='pa',remove_nuktas=False,decompose_nuktas=False,nasals_mode='do_nothing',do_normalize_chandras=False,
                 do_normalize_vowel_ending=False,do_normalize_numerals=False,convert_numerals_to_native=False,do_colon_to_visarga=False,
@@ -639,8 +814,8 @@ class GurmukhiNormalizer(BaseNormalizer):
         ## http://www.unicode.org/versions/Unicode12.1.0/ch12.pdf
         ## Table 12-16
 
-        for k,v in GurmukhiNormalizer.VOWEL_NORM_MAPS.items():
-            text=text.replace(k,v)
+        text=GurmukhiNormalizer._VOWEL_NORM_RE.sub(
+                lambda m: GurmukhiNormalizer.VOWEL_NORM_MAPS[m.group(0)],text)
         
         ## the above mappings should account for majority of the variantions, 
         ## Rest are handled via this generic rule which looks at the diacritic 
@@ -670,21 +845,21 @@ class GurmukhiNormalizer(BaseNormalizer):
         # Tippi 
         if self.do_canonicalize_tippi:
             # Replace tippi-based germination by addak for nasal consonants
-            text=re.sub('\u0a70([\u0a19\u0a1e\u0a23\u0a28\u0a2e])','\u0a71\\1',text)
+            text=GurmukhiNormalizer._TIPPI_TO_ADDAK_RE.sub('\u0a71\\1',text)
             # Replace tippis by bindi
             text=text.replace('\u0a70','\u0a02')
         else:
             # Fix to tippis (from bindi)
-            text=re.sub('([\u0a05\u0a07\u0a09\u0a15-\u0a39\u0a3c\u0a3f\u0a41\u0a42\u0a59-\u0a5e])\u0a02','\\1\u0a70',text)
+            text=GurmukhiNormalizer._BINDI_TO_TIPPI_RE.sub('\\1\u0a70',text)
             # Fix to bindis (from tippis)
-            text=re.sub('([^\u0a05\u0a07\u0a09\u0a15-\u0a39\u0a3c\u0a3f\u0a41\u0a42\u0a59-\u0a5e])\u0a70','\\1\u0a02',text)
+            text=GurmukhiNormalizer._TIPPI_TO_BINDI_RE.sub('\\1\u0a02',text)
             # Fix germination to tippis (from addak) for nasal consonants
-            text=re.sub('\u0a71([\u0a19\u0a1e\u0a23\u0a28\u0a2e])','\u0a70\\1',text)
+            text=GurmukhiNormalizer._ADDAK_TO_TIPPI_RE.sub('\u0a70\\1',text)
         
         # Addak
         if self.do_canonicalize_addak:
             ## replace addak+consonant with consonat+halant+consonant
-            text=re.sub(r'\u0a71(.)','\\1\u0a4d\\1',text)
+            text=GurmukhiNormalizer._ADDAK_RE.sub(GurmukhiNormalizer._ADDAK_REPL,text)
         # else:
         #     ## TODO: replace consonat+halant+consonant with addak+consonant
         #     pass
@@ -693,31 +868,19 @@ class GurmukhiNormalizer(BaseNormalizer):
         text=super(GurmukhiNormalizer,self).normalize(text)
         
         if self.remove_nuktas:
-            text=text.replace(GurmukhiNormalizer.NUKTA,'')
-            # normalizing Nukta based composite characters
-            text=text.replace('\u0a33','\u0a32')
-            text=text.replace('\u0a36','\u0a38')
-            text=text.replace('\u0a59','\u0a16')
-            text=text.replace('\u0a5a','\u0a17')
-            text=text.replace('\u0a5b','\u0a1c')
-            text=text.replace('\u0a5e','\u0a2b')
+            # remove nukta and normalize Nukta based composite characters
+            text=_replace_found_chars(text,GurmukhiNormalizer._NUKTA_REMOVE_PROBE,
+                    GurmukhiNormalizer._NUKTA_REMOVE_MAPS)
         else:
             if self.decompose_nuktas:
                 # decomposing Nukta based composite characters
-                text=text.replace('\u0a33','\u0a32'+GurmukhiNormalizer.NUKTA)
-                text=text.replace('\u0a36','\u0a38'+GurmukhiNormalizer.NUKTA)
-                text=text.replace('\u0a59','\u0a16'+GurmukhiNormalizer.NUKTA)
-                text=text.replace('\u0a5a','\u0a17'+GurmukhiNormalizer.NUKTA)
-                text=text.replace('\u0a5b','\u0a1c'+GurmukhiNormalizer.NUKTA)
-                text=text.replace('\u0a5e','\u0a2b'+GurmukhiNormalizer.NUKTA)
+                text=_replace_found_chars(text,GurmukhiNormalizer._NUKTA_DECOMPOSE_PROBE,
+                        GurmukhiNormalizer._NUKTA_DECOMPOSE_MAPS)
             else:
                 # recomposing Nukta based composite characters
-                text=text.replace('\u0a32'+GurmukhiNormalizer.NUKTA, '\u0a33')
-                text=text.replace('\u0a38'+GurmukhiNormalizer.NUKTA, '\u0a36')
-                text=text.replace('\u0a16'+GurmukhiNormalizer.NUKTA, '\u0a59')
-                text=text.replace('\u0a17'+GurmukhiNormalizer.NUKTA, '\u0a5a')
-                text=text.replace('\u0a1c'+GurmukhiNormalizer.NUKTA, '\u0a5b')
-                text=text.replace('\u0a2b'+GurmukhiNormalizer.NUKTA, '\u0a5e')
+                if GurmukhiNormalizer.NUKTA in text:
+                    for k,v in GurmukhiNormalizer._NUKTA_RECOMPOSE_MAPS.items():
+                        text=text.replace(k,v)
 
         # replace the poorna virama codes specific to script 
         # with generic Indic script codes
@@ -727,8 +890,8 @@ class GurmukhiNormalizer(BaseNormalizer):
         ## replace pipe character for poorna virama 
         text=text.replace('\u007c','\u0964')
 
-        if self.do_colon_to_visarga: # correct visarge 
-            text=re.sub(r'([\u0a00-\u0a7f]):','\\1\u0a03',text)
+        if self.do_colon_to_visarga and ':' in text: # correct visarge 
+            text=self._VISARGA_RE.sub(self._VISARGA_REPL,text)
 
         return text
 
@@ -743,6 +906,9 @@ class GujaratiNormalizer(BaseNormalizer):
 
     NUKTA='\u0ABC' 
 
+    _VISARGA_RE=re.compile(r'([\u0a80-\u0aff]):')
+    _VISARGA_REPL='\\1\u0a83'
+
     def __init__(self,lang='gu',remove_nuktas=False,decompose_nuktas=False,nasals_mode='do_nothing',do_normalize_chandras=False,
                     do_normalize_vowel_ending=False,do_normalize_numerals=False,convert_numerals_to_native=False,do_colon_to_visarga=False):
         super(GujaratiNormalizer,self).__init__(lang,remove_nuktas,decompose_nuktas,nasals_mode,do_normalize_chandras,do_normalize_vowel_ending,do_normalize_numerals,convert_numerals_to_native,do_colon_to_visarga)
@@ -762,8 +928,8 @@ class GujaratiNormalizer(BaseNormalizer):
         text=text.replace('\u0ae4','\u0964')
         text=text.replace('\u0ae5','\u0965')
 
-        if self.do_colon_to_visarga: # correct visarge 
-            text=re.sub(r'([\u0a80-\u0aff]):','\\1\u0a83',text)
+        if self.do_colon_to_visarga and ':' in text: # correct visarge 
+            text=self._VISARGA_RE.sub(self._VISARGA_REPL,text)
 
         return text
 
@@ -782,6 +948,24 @@ class OriyaNormalizer(BaseNormalizer):
 
     NUKTA='\u0B3C' 
 
+    _VISARGA_RE=re.compile(r'([\u0b00-\u0b7f]):')
+    _VISARGA_REPL='\\1\u0b03'
+    # every rewrite after the common normalization needs a character of the script
+    _SCRIPT_PROBE=re.compile('[\u0b00-\u0b7f]')
+
+    # nukta based composite characters and their base consonants
+    NUKTA_COMPOSITES={
+        '\u0b5c': '\u0b21',
+        '\u0b5d': '\u0b22',
+    }
+    (_NUKTA_DECOMPOSE_MAPS,_NUKTA_DECOMPOSE_PROBE,
+        _NUKTA_RECOMPOSE_MAPS)=_init_nukta_tables(NUKTA,NUKTA_COMPOSITES)
+
+    # nukta removal: drop the nukta and map the nukta based composite
+    # characters to their base consonants
+    _NUKTA_REMOVE_MAPS={NUKTA: '', **NUKTA_COMPOSITES}
+    _NUKTA_REMOVE_PROBE=_init_char_probe(_NUKTA_REMOVE_MAPS)
+
     VOWEL_NORM_MAPS={
         ## See Table 12-22 in http://www.unicode.org/versions/Unicode12.1.0/ch12.pdf
         '\u0b05\u0b3e': '\u0b06',
@@ -800,25 +984,27 @@ class OriyaNormalizer(BaseNormalizer):
 
         # common normalization for Indic scripts 
         text=super(OriyaNormalizer,self).normalize(text)
+        if not OriyaNormalizer._SCRIPT_PROBE.search(text):
+            return text
 
         ## standard vowel replacements as per suggestions in Unicode documents
         for k,v in OriyaNormalizer.VOWEL_NORM_MAPS.items():
             text=text.replace(k,v)
 
         if self.remove_nuktas:
-            text=text.replace(OriyaNormalizer.NUKTA,'')
-            # normalizing Nukta based composite characters
-            text=text.replace('\u0b5c','\u0b21')
-            text=text.replace('\u0b5d','\u0b22')
+            # remove nukta and normalize Nukta based composite characters
+            text=_replace_found_chars(text,OriyaNormalizer._NUKTA_REMOVE_PROBE,
+                    OriyaNormalizer._NUKTA_REMOVE_MAPS)
         else:
             if self.decompose_nuktas:
                 # decomposing Nukta based composite characters
-                text=text.replace('\u0b5c','\u0b21'+OriyaNormalizer.NUKTA)
-                text=text.replace('\u0b5d','\u0b22'+OriyaNormalizer.NUKTA)
+                text=_replace_found_chars(text,OriyaNormalizer._NUKTA_DECOMPOSE_PROBE,
+                        OriyaNormalizer._NUKTA_DECOMPOSE_MAPS)
             else:
                 # recomposing Nukta based composite characters
-                text=text.replace('\u0b21'+OriyaNormalizer.NUKTA, '\u0b5c')
-                text=text.replace('\u0b22'+OriyaNormalizer.NUKTA, '\u0b5d')
+                if OriyaNormalizer.NUKTA in text:
+                    for k,v in OriyaNormalizer._NUKTA_RECOMPOSE_MAPS.items():
+                        text=text.replace(k,v)
 
         # replace the poorna virama codes specific to script 
         # with generic Indic script codes
@@ -851,8 +1037,8 @@ class OriyaNormalizer(BaseNormalizer):
         # additional consonant - not clear how to handle this
         # ignore
 
-        if self.do_colon_to_visarga: # correct visarge 
-            text=re.sub(r'([\u0b00-\u0b7f]):','\\1\u0b03',text)
+        if self.do_colon_to_visarga and ':' in text: # correct visarge 
+            text=self._VISARGA_RE.sub(self._VISARGA_REPL,text)
 
         return text
 
@@ -871,6 +1057,29 @@ class BengaliNormalizer(BaseNormalizer):
 
     NUKTA='\u09BC' 
 
+    _VISARGA_RE=re.compile(r'([\u0980-\u09ff]):')
+    _VISARGA_REPL='\\1\u0983'
+
+    # nukta based composite characters and their base consonants
+    NUKTA_COMPOSITES={
+        '\u09dc': '\u09a1',
+        '\u09dd': '\u09a2',
+        '\u09df': '\u09af',
+    }
+    (_NUKTA_DECOMPOSE_MAPS,_NUKTA_DECOMPOSE_PROBE,
+        _NUKTA_RECOMPOSE_MAPS)=_init_nukta_tables(NUKTA,NUKTA_COMPOSITES)
+
+    # nukta removal: drop the nukta and map the nukta based composite
+    # characters to their base consonants
+    _NUKTA_REMOVE_MAPS={NUKTA: '', **NUKTA_COMPOSITES}
+    _NUKTA_REMOVE_PROBE=_init_char_probe(_NUKTA_REMOVE_MAPS)
+
+    TWO_PART_VOWEL_MAPS={
+        '\u09c7\u09be':'\u09cb',
+        '\u09c7\u09d7':'\u09cc',
+    }
+    _TWO_PART_VOWEL_RE=re.compile('\u09c7[\u09be\u09d7]')
+
     def __init__(self,lang='bn',remove_nuktas=False,decompose_nuktas=False,nasals_mode='do_nothing',do_normalize_chandras=False,
                     do_normalize_vowel_ending=False,do_normalize_numerals=False,convert_numerals_to_native=False,do_colon_to_visarga=False,
                     do_remap_assamese_chars=False,do_canonicalize_khanda_ta=False):
@@ -884,22 +1093,19 @@ class BengaliNormalizer(BaseNormalizer):
         text=super(BengaliNormalizer,self).normalize(text)
 
         if self.remove_nuktas:
-            text=text.replace(BengaliNormalizer.NUKTA,'')
-            # normalizing Nukta based composite characters
-            text=text.replace('\u09dc','\u09a1')
-            text=text.replace('\u09dd','\u09a2')
-            text=text.replace('\u09df','\u09af')
+            # remove nukta and normalize Nukta based composite characters
+            text=_replace_found_chars(text,BengaliNormalizer._NUKTA_REMOVE_PROBE,
+                    BengaliNormalizer._NUKTA_REMOVE_MAPS)
         else:
             if self.decompose_nuktas:
                 # decomposing Nukta based composite characters
-                text=text.replace('\u09dc','\u09a1'+BengaliNormalizer.NUKTA)
-                text=text.replace('\u09dd','\u09a2'+BengaliNormalizer.NUKTA)
-                text=text.replace('\u09df','\u09af'+BengaliNormalizer.NUKTA)
+                text=_replace_found_chars(text,BengaliNormalizer._NUKTA_DECOMPOSE_PROBE,
+                        BengaliNormalizer._NUKTA_DECOMPOSE_MAPS)
             else:
                 # recomposing Nukta based composite characters
-                text=text.replace('\u09a1'+BengaliNormalizer.NUKTA, '\u09dc')
-                text=text.replace('\u09a2'+BengaliNormalizer.NUKTA, '\u09dd')
-                text=text.replace('\u09af'+BengaliNormalizer.NUKTA, '\u09df')
+                if BengaliNormalizer.NUKTA in text:
+                    for k,v in BengaliNormalizer._NUKTA_RECOMPOSE_MAPS.items():
+                        text=text.replace(k,v)
 
         if self.lang=='as':
             if self.do_remap_assamese_chars:
@@ -922,12 +1128,13 @@ class BengaliNormalizer(BaseNormalizer):
         # replace bengali currency numerator four for poorna virama  (it looks similar and is used as a substitute)
         text=text.replace('\u09f7','\u0964')
 
-        # two part dependent vowels
-        text=text.replace('\u09c7\u09be','\u09cb')
-        text=text.replace('\u09c7\u09d7','\u09cc')
+        # two part dependent vowels, both start with the e sign
+        if '\u09c7' in text:
+            text=BengaliNormalizer._TWO_PART_VOWEL_RE.sub(
+                    lambda m: BengaliNormalizer.TWO_PART_VOWEL_MAPS[m.group(0)],text)
 
-        if self.do_colon_to_visarga: # correct visarge 
-            text=re.sub(r'([\u0980-\u09ff]):','\\1\u0983',text)
+        if self.do_colon_to_visarga and ':' in text: # correct visarge 
+            text=self._VISARGA_RE.sub(self._VISARGA_REPL,text)
 
         return text
 
@@ -941,6 +1148,9 @@ class TamilNormalizer(BaseNormalizer):
     * replace colon ':' by visarga if the colon follows a charcter in this script 
     """
 
+    # translingual aytham before a consonant
+    _AYTHAM_RE=re.compile('\u0b83([\u0b95-\u0bb9])')
+
     def __init__(self,lang='ta',remove_nuktas=False,decompose_nuktas=False,nasals_mode='do_nothing',
             do_normalize_chandras=False,do_normalize_vowel_ending=False,do_normalize_numerals=False,convert_numerals_to_native=False,do_colon_to_visarga=False,
             normalize_grantha=False,do_convert_to_reformed_vowels=False):
@@ -967,7 +1177,7 @@ class TamilNormalizer(BaseNormalizer):
         if self.remove_nuktas:
             # In Tamil, it's equivalent to removing translingual ஃ
             # like ஃஜ (za), ஃக (qa), ஃப (fa), ஃவ (wa), ஃஸ (xa), ஃஶ (zha)
-            text=re.sub('\u0b83([\u0b95-\u0bb9])','\\1',text)
+            text=TamilNormalizer._AYTHAM_RE.sub('\\1',text)
             # In other places, ஃ denotes a voiceless uvular fricative or visarga if final
 
         if self.normalize_grantha:
@@ -1003,6 +1213,9 @@ class TeluguNormalizer(BaseNormalizer):
     * replace colon ':' by visarga if the colon follows a charcter in this script 
     """
 
+    _VISARGA_RE=re.compile(r'([\u0c00-\u0c7f]):')
+    _VISARGA_REPL='\\1\u0c03'
+
     def __init__(self,lang='te',remove_nuktas=False,decompose_nuktas=False,nasals_mode='do_nothing',
                 do_normalize_chandras=False,do_normalize_vowel_ending=False,do_normalize_numerals=False,convert_numerals_to_native=False,do_colon_to_visarga=False):
         super(TeluguNormalizer,self).__init__(lang,remove_nuktas,decompose_nuktas,nasals_mode,do_normalize_chandras,do_normalize_vowel_ending,do_normalize_numerals,convert_numerals_to_native,do_colon_to_visarga)
@@ -1024,8 +1237,8 @@ class TeluguNormalizer(BaseNormalizer):
         # dependent vowels
         text=text.replace('\u0c46\u0c56','\u0c48')
 
-        if self.do_colon_to_visarga: # correct visarge 
-            text=re.sub(r'([\u0c00-\u0c7f]):','\\1\u0c03',text)
+        if self.do_colon_to_visarga and ':' in text: # correct visarge 
+            text=self._VISARGA_RE.sub(self._VISARGA_REPL,text)
 
         return text
 
@@ -1043,6 +1256,9 @@ class KannadaNormalizer(BaseNormalizer):
 
     NUKTA='\u0CBC'
 
+    _VISARGA_RE=re.compile(r'([\u0c80-\u0cff]):')
+    _VISARGA_REPL='\\1\u0c83'
+
     def __init__(self,lang='kn',remove_nuktas=False,decompose_nuktas=False,nasals_mode='do_nothing',
             do_normalize_chandras=False,do_normalize_vowel_ending=False,do_normalize_numerals=False,convert_numerals_to_native=False,do_colon_to_visarga=False):
         super(KannadaNormalizer,self).__init__(lang,remove_nuktas,decompose_nuktas,nasals_mode,do_normalize_chandras,do_normalize_vowel_ending,do_normalize_numerals,convert_numerals_to_native,do_colon_to_visarga)
@@ -1068,8 +1284,8 @@ class KannadaNormalizer(BaseNormalizer):
         text=text.replace('\u0cc6\u0cc2','\u0cca')
         text=text.replace('\u0cca\u0cd5','\u0ccb')
 
-        if self.do_colon_to_visarga: # correct visarge 
-            text=re.sub(r'([\u0c80-\u0cff]):','\\1\u0c83',text)
+        if self.do_colon_to_visarga and ':' in text: # correct visarge 
+            text=self._VISARGA_RE.sub(self._VISARGA_REPL,text)
 
         return text
 
@@ -1097,53 +1313,83 @@ class MalayalamNormalizer(BaseNormalizer):
                     '\u0d56': '\u0d34',
                  }
 
+    # chillu to its base consonant with virama
+    _CHILLU_VIRAMA_MAP={chillu: '{}\u0d4d'.format(char) for chillu, char in CHILLU_CHAR_MAP.items()}
+    _CHILLU_PROBE=_init_char_probe(_CHILLU_VIRAMA_MAP)
+
+    # consonant to its chillu form, the inverse of CHILLU_CHAR_MAP
+    _CONSONANT_CHILLU_MAP={char: chillu for chillu, char in CHILLU_CHAR_MAP.items()}
+    # virama-consonant followed by another character of the script
+    _INTERMEDIATE_VIRAMA_RE=re.compile('([{}])\u0d4d(?=[\u0d00-\u0d7f])'.format(''.join(CHILLU_CHAR_MAP.values())))
+    _VIRAMA_RE=re.compile('([{}])\u0d4d'.format(''.join(CHILLU_CHAR_MAP.values())))
+    # old encoding of chillus (till Unicode 5.0): virama-consonant followed by ZWJ
+    _VIRAMA_ZWJ_RE=re.compile('([{}])\u0d4d\u200d'.format(''.join(CHILLU_CHAR_MAP.values())))
+
+    _VISARGA_RE=re.compile(r'([\u0d00-\u0d7f]):')
+    _VISARGA_REPL='\\1\u0d03'
+    # every rewrite after the common normalization needs a character of the script
+    _SCRIPT_PROBE=re.compile('[\u0d00-\u0d7f]')
+
+    # virama after a consonant at the end of a word
+    _FINAL_VIRAMA_RE=re.compile('([\u0d15-\u0d3a])\u0d4d([^\u0d00-\u0d7f]|$)')
+    # explicit half-u after a consonant
+    _HALF_U_RE=re.compile('([\u0d15-\u0d3a])\u0d41\u0d4d')
+
+    # Vertical/Circular Virama (Old Orthography) to Candrakkala
+    _VIRAMA_TABLE=str.maketrans({
+        '\u0d3b': '\u0d4d',
+        '\u0d3c': '\u0d4d',
+    })
+
+    _VIRAMA_PROBE=_init_translate_probe(_VIRAMA_TABLE)
+
+    # rewrites applied in a single pass after the chillu normalization
+    TAIL_MAPS={
+        # dependent vowels
+        '\u0d46\u0d3e': '\u0d4a',
+        '\u0d47\u0d3e': '\u0d4b',
+        # au forms
+        '\u0d46\u0d57': '\u0d4c',
+        '\u0d57': '\u0d4c',
+        # poorna virama codes specific to script to generic Indic script codes
+        '\u0d64': '\u0964',
+        '\u0d65': '\u0965',
+        # Old orthographic germination ഺ -> റ്റ
+        '\u0d3a': '\u0d31\u0d4d\u0d31',
+    }
+    # longer sequences are listed first, so that ൌ is rewritten as a whole
+    _TAIL_RE=_init_literal_alternation(TAIL_MAPS)
+
     def _canonicalize_chillus(self,text):
         # Note: This will cause confusion between chillu-based virama and half-u
         # Recommended to use final_virama_to_half_u_explicit() before this
-        for chillu, char in MalayalamNormalizer.CHILLU_CHAR_MAP.items(): 
-            text=text.replace(chillu,'{}\u0d4d'.format(char)) 
-        return text
+        return _replace_found_chars(text,MalayalamNormalizer._CHILLU_PROBE,
+                MalayalamNormalizer._CHILLU_VIRAMA_MAP)
     
     def _intermediate_virama_to_chillus(self,text):
         # Convert intermediate virama-consonants to chillu forms
         # Does not convert final virama-consonants, since it's ambiguous (if it's half-u or glottal-stop)
-        text=re.sub('\u0d23\u0d4d([\u0d00-\u0d7f])','\u0d7a\\1',text)
-        text=re.sub('\u0d28\u0d4d([\u0d00-\u0d7f])','\u0d7b\\1',text)
-        text=re.sub('\u0d30\u0d4d([\u0d00-\u0d7f])','\u0d7c\\1',text)
-        text=re.sub('\u0d32\u0d4d([\u0d00-\u0d7f])','\u0d7d\\1',text)
-        text=re.sub('\u0d33\u0d4d([\u0d00-\u0d7f])','\u0d7e\\1',text)
-        text=re.sub('\u0d15\u0d4d([\u0d00-\u0d7f])','\u0d7f\\1',text)
-        text=re.sub('\u0d2e\u0d4d([\u0d00-\u0d7f])','\u0d54\\1',text)
-        text=re.sub('\u0d2f\u0d4d([\u0d00-\u0d7f])','\u0d55\\1',text)
-        text=re.sub('\u0d34\u0d4d([\u0d00-\u0d7f])','\u0d56\\1',text)
-        return text
+        return MalayalamNormalizer._INTERMEDIATE_VIRAMA_RE.sub(
+                lambda m: MalayalamNormalizer._CONSONANT_CHILLU_MAP[m.group(1)],text)
     
     def _all_virama_to_chillus(self,text):
         # Warning: Use `_intermediate_virama_to_chillus()` unless you know what you're doing
         # Convert all virama-consonants to chillu forms
-        text=text.replace('\u0d23\u0d4d','\u0d7a')
-        text=text.replace('\u0d28\u0d4d','\u0d7b')
-        text=text.replace('\u0d30\u0d4d','\u0d7c')
-        text=text.replace('\u0d32\u0d4d','\u0d7d')
-        text=text.replace('\u0d33\u0d4d','\u0d7e')
-        text=text.replace('\u0d15\u0d4d','\u0d7f')
-        text=text.replace('\u0d2e\u0d4d','\u0d54')
-        text=text.replace('\u0d2f\u0d4d','\u0d55')
-        text=text.replace('\u0d34\u0d4d','\u0d56')
-        return text
+        return MalayalamNormalizer._VIRAMA_RE.sub(
+                lambda m: MalayalamNormalizer._CONSONANT_CHILLU_MAP[m.group(1)],text)
     
     def _final_virama_to_half_u_explicit(self,text):
         # Chandrakala at the end of word is always half-u
         # Make it explicit: അവന്‌ -> അവനു് 
-        return re.sub('([\u0d15-\u0d3a])\u0d4d([^\u0d00-\u0d7f]|$)', '\\1\u0d41\u0d4d\\2', text)
+        return MalayalamNormalizer._FINAL_VIRAMA_RE.sub('\\1\u0d41\u0d4d\\2', text)
     
     def _final_virama_to_u(self,text):
         # By doing this, you'll always implicitly interpret final-u as half-u (as per pre-modern Grammar)
 
         # അവനു് --> അവനു (Assuming explicit-half-u might also have occured in middle positions)
-        text = re.sub('([\u0d15-\u0d3a])\u0d41\u0d4d', '\\1\u0d41', text)
+        text = MalayalamNormalizer._HALF_U_RE.sub('\\1\u0d41', text)
         # അവന്‌ -> അവനു (Only at final positions)
-        return re.sub('([\u0d15-\u0d3a])\u0d4d([^\u0d00-\u0d7f]|$)', '\\1\u0d41\\2', text)
+        return MalayalamNormalizer._FINAL_VIRAMA_RE.sub('\\1\u0d41\\2', text)
 
     def _correct_geminated_T(self,text):
         return text.replace('\u0d31\u0d4d\u0d31','\u0d1f\u0d4d\u0d1f')
@@ -1165,31 +1411,29 @@ class MalayalamNormalizer(BaseNormalizer):
 
         # Change from old encoding of chillus (till Unicode 5.0) to new encoding
         # text=text.replace('\u0d28\u0d4d\u0d31','\u0d7b\u0d4d\u0d31') # ന്റ -> ൻ്റ 
-        text=text.replace('\u0d23\u0d4d\u200d','\u0d7a')
-        text=text.replace('\u0d28\u0d4d\u200d','\u0d7b')
-        text=text.replace('\u0d30\u0d4d\u200d','\u0d7c')
-        text=text.replace('\u0d32\u0d4d\u200d','\u0d7d')
-        text=text.replace('\u0d33\u0d4d\u200d','\u0d7e')
-        text=text.replace('\u0d15\u0d4d\u200d','\u0d7f')
-        # Unicode 9.0 introduces 3 new chillus
-        text=text.replace('\u0d2e\u0d4d\u200d','\u0d54')
-        text=text.replace('\u0d2f\u0d4d\u200d','\u0d55')
-        text=text.replace('\u0d34\u0d4d\u200d','\u0d56')
+        # (includes the 3 new chillus introduced in Unicode 9.0)
+        if '\u200d' in text:
+            text=MalayalamNormalizer._VIRAMA_ZWJ_RE.sub(
+                    lambda m: MalayalamNormalizer._CONSONANT_CHILLU_MAP[m.group(1)],text)
         # Dot reph to chillu r
         text=text.replace('\u0d4e','\u0d7c')
 
         # common normalization for Indic scripts 
         text=super(MalayalamNormalizer,self).normalize(text)
+        if not MalayalamNormalizer._SCRIPT_PROBE.search(text):
+            return text
 
         # Vertical/Circular Virama (Old Orthography) to Candrakkala
-        text=text.replace('\u0d3b','\u0d4d')
-        text=text.replace('\u0d3c','\u0d4d')
+        if MalayalamNormalizer._VIRAMA_PROBE.search(text):
+            text=text.translate(MalayalamNormalizer._VIRAMA_TABLE)
 
-        if self.do_explicit_half_u:
-            text=self._final_virama_to_half_u_explicit(text)
-        
-        if self.do_half_u_to_u:
-            text=self._final_virama_to_u(text)
+        # both half-u rewrites need a chandrakkala
+        if '\u0d4d' in text:
+            if self.do_explicit_half_u:
+                text=self._final_virama_to_half_u_explicit(text)
+            
+            if self.do_half_u_to_u:
+                text=self._final_virama_to_u(text)
 
         # Normalize chillus
         if self.do_canonicalize_chillus:
@@ -1199,33 +1443,25 @@ class MalayalamNormalizer(BaseNormalizer):
         elif self.do_convert_all_viramas_to_chillus:
             text=self._all_virama_to_chillus(text)
 
-        # replace the poorna virama codes specific to script 
-        # with generic Indic script codes
-        text=text.replace('\u0d64','\u0964')
-        text=text.replace('\u0d65','\u0965')
-
-        # dependent vowels
-        text=text.replace('\u0d46\u0d3e','\u0d4a')
-        text=text.replace('\u0d47\u0d3e','\u0d4b')
-
-        # au forms
-        text=text.replace('\u0d46\u0d57','\u0d4c')
-        text=text.replace('\u0d57','\u0d4c')
-        
-        # Old orthographic germination ഺ -> റ്റ
-        text=text.replace('\u0d3a','\u0d31\u0d4d\u0d31')
+        # dependent vowels, au forms, poorna virama codes and 
+        # old orthographic germination in one pass
+        text=MalayalamNormalizer._TAIL_RE.sub(
+                lambda m: MalayalamNormalizer.TAIL_MAPS[m.group(0)],text)
 
         # correct geminated T
         if self.do_correct_geminated_T:
             text=self._correct_geminated_T(text)
 
-        if self.do_colon_to_visarga: # correct visarga 
-            text=re.sub(r'([\u0d00-\u0d7f]):','\\1\u0d03',text)
+        if self.do_colon_to_visarga and ':' in text: # correct visarga 
+            text=self._VISARGA_RE.sub(self._VISARGA_REPL,text)
 
         return text
 
 class SinhalaNormalizer(BaseNormalizer):
 
+    _VISARGA_RE=re.compile(r'([\u0d80-\u0dff]):')
+    _VISARGA_REPL='\\1\u0d83'
+
     MISRA_TO_SUDDA_CONSONANTS_MAP = {
         # mahA-prAna -> alpa-prAna
         '\u0D9B': '\u0D9A', # kh->k
@@ -1272,6 +1508,26 @@ class SinhalaNormalizer(BaseNormalizer):
         '\u0DF3': '\u0DCA\u0DBD\u0DD3', # ෳ ->  ්ලී 
     }
     
+    ## Taken from: https://github.com/google/language-resources/blob/master/si/normalize_text.py
+    VOWEL_JOIN_MAPS = {
+        # Vowel letters; cf. Table 13-2 in The Unicode Standard Version 9.0:
+        '\u0D85\u0DCF': '\u0D86', # අා -> ආ
+        '\u0D85\u0DD0': '\u0D87', # අැ -> ඇ
+        '\u0D85\u0DD1': '\u0D88', # අෑ -> ඈ
+        '\u0D8B\u0DDF': '\u0D8C', # උෟ -> ඌ
+        '\u0D8D\u0DD8': '\u0D8E', # ඍෘ -> ඎ
+        '\u0D8F\u0DDF': '\u0D90', # ඏෟ -> ඐ
+        '\u0D91\u0DCA': '\u0D92', # එ් -> ඒ
+        '\u0D91\u0DCA\u0DCA': '\u0D92', # එ්් -> ඒ (the ඒ from එ් followed by a redundant virama)
+        '\u0D92\u0DCA': '\u0D92', # ඒ් -> ඒ  (redundant virama)
+        '\u0D91\u0DD9': '\u0D93', # එෙ -> ඓ
+        '\u0D94\u0DDF': '\u0D96', # ඔෟ -> ඖ
+        # Dependent vowel signs:
+        '\u0DD9\u0DD9': '\u0DDB', # කෙෙ -> කෛ
+        '\u0DD8\u0DD8': '\u0DF2', # කෘෘ -> කෲ
+    }
+    _VOWEL_JOIN_RE=_init_literal_alternation(VOWEL_JOIN_MAPS)
+
     def __init__(self,lang='si',remove_nuktas=False,decompose_nuktas=False,nasals_mode='do_nothing',do_normalize_chandras=False,
                 do_normalize_vowel_ending=False,do_normalize_numerals=False,convert_numerals_to_native=False,do_colon_to_visarga=False,
                 misra_consonants_to_suddha=False,misra_vowels_to_suddha=False,
@@ -1309,21 +1565,8 @@ class SinhalaNormalizer(BaseNormalizer):
         # common normalization for Indic scripts 
         text=super(SinhalaNormalizer,self).normalize(text)
 
-        ## Taken from: https://github.com/google/language-resources/blob/master/si/normalize_text.py
-        # Vowel letters; cf. Table 13-2 in The Unicode Standard Version 9.0:
-        text = text.replace('\u0D85\u0DCF', '\u0D86')  # අා -> ආ
-        text = text.replace('\u0D85\u0DD0', '\u0D87')  # අැ -> ඇ
-        text = text.replace('\u0D85\u0DD1', '\u0D88')  # අෑ -> ඈ
-        text = text.replace('\u0D8B\u0DDF', '\u0D8C')  # උෟ -> ඌ
-        text = text.replace('\u0D8D\u0DD8', '\u0D8E')  # ඍෘ -> ඎ
-        text = text.replace('\u0D8F\u0DDF', '\u0D90')  # ඏෟ -> ඐ
-        text = text.replace('\u0D91\u0DCA', '\u0D92')  # එ් -> ඒ
-        text = text.replace('\u0D92\u0DCA', '\u0D92')  # ඒ් -> ඒ  (redundant virama)
-        text = text.replace('\u0D91\u0DD9', '\u0D93')  # එෙ -> ඓ
-        text = text.replace('\u0D94\u0DDF', '\u0D96')  # ඔෟ -> ඖ
-        # Dependent vowel signs:
-        text = text.replace('\u0DD9\u0DD9', '\u0DDB')  # කෙෙ -> කෛ
-        text = text.replace('\u0DD8\u0DD8', '\u0DF2')  # කෘෘ -> කෲ
+        # vowel letter and dependent vowel sign joins in one pass
+        text=SinhalaNormalizer._VOWEL_JOIN_RE.sub(lambda m: SinhalaNormalizer.VOWEL_JOIN_MAPS[m.group(0)],text)
 
         if self.do_prenasalized_consonants_to_clusters:
             text=self.convert_prenasalized_consonants_to_clusters(text)
@@ -1337,8 +1580,8 @@ class SinhalaNormalizer(BaseNormalizer):
         if self.misra_vowels_to_suddha:
             text = text.translate(self.misra_vowels_to_suddha_converter)
 
-        if self.do_colon_to_visarga: # correct visarge 
-            text=re.sub(r'([\u0d80-\u0dff]):','\\1\u0d83',text)
+        if self.do_colon_to_visarga and ':' in text: # correct visarge 
+            text=self._VISARGA_RE.sub(self._VISARGA_REPL,text)
         return text
 
 class UrduShahmukhiNormalizer(NormalizerI):
@@ -1347,6 +1590,28 @@ class UrduShahmukhiNormalizer(NormalizerI):
     '''
     EAST_ARABIC_NUMERALS = "۰۱۲۳۴۵۶۷۸۹"
 
+    arabic_normalizer = str.maketrans({
+        ',': '،',
+        '?': '؟',
+        '؛': ';',
+        '٪': '%',
+
+        '٫': '.', # Arabic decimal point
+        '٬': ',', # Arabic thousands separator
+        '؍': '/', # Arabic date separator
+        'ࣇ': 'لؕ', # https://wikipedia.org/wiki/%E0%A3%87
+        'ﷲ': 'اللہ',
+    })
+
+    numerals_normalizer = str.maketrans({
+        native: str(i) for i, native in enumerate(EAST_ARABIC_NUMERALS)
+    })
+    numerals_to_persian = str.maketrans({
+        str(i): native for i, native in enumerate(EAST_ARABIC_NUMERALS)
+    })
+    _EAST_ARABIC_NUMERALS_PROBE = _init_translate_probe(numerals_normalizer)
+    _NUMERALS_PROBE = _init_translate_probe(numerals_to_persian)
+
     def __init__(self, lang='ur', remove_diacritics=True, do_normalize_numerals=False,convert_numerals_to_native=False):
         self.lang = lang
         self.remove_diacritic_marks = remove_diacritics
@@ -1361,25 +1626,6 @@ class UrduShahmukhiNormalizer(NormalizerI):
         from importlib import import_module
         self.preprocessing = import_module('urduhack.preprocessing')
         self.normalization = import_module('urduhack.normalization.character')
-        self.arabic_normalizer = str.maketrans({
-            ',': '،',
-            '?': '؟',
-            '؛': ';',
-            '٪': '%',
-
-            '٫': '.', # Arabic decimal point
-            '٬': ',', # Arabic thousands separator
-            '؍': '/', # Arabic date separator
-            'ࣇ': 'لؕ', # https://wikipedia.org/wiki/%E0%A3%87
-            'ﷲ': 'اللہ',
-        })
-        
-        self.numerals_normalizer = str.maketrans({
-            native: str(i) for i, native in enumerate(UrduShahmukhiNormalizer.EAST_ARABIC_NUMERALS)
-        })
-        self.numerals_to_persian = str.maketrans({
-            str(i): native for i, native in enumerate(UrduShahmukhiNormalizer.EAST_ARABIC_NUMERALS)
-        })
     
     def normalize(self, text):
         text = self._normalize_punctuations(text)
@@ -1388,11 +1634,13 @@ class UrduShahmukhiNormalizer(NormalizerI):
         if self.remove_diacritic_marks:
             text = self.normalization.remove_diacritics(text)
         text = self.normalization.normalize_characters(text)
-        text = text.translate(self.arabic_normalizer)
+        text = text.translate(UrduShahmukhiNormalizer.arabic_normalizer)
         if self.normalize_numerals:
-            text = text.translate(self.numerals_normalizer)
+            if UrduShahmukhiNormalizer._EAST_ARABIC_NUMERALS_PROBE.search(text):
+                text = text.translate(UrduShahmukhiNormalizer.numerals_normalizer)
         elif self.convert_numerals_to_native:
-            text = text.translate(self.numerals_to_persian)
+            if UrduShahmukhiNormalizer._NUMERALS_PROBE.search(text):
+                text = text.translate(UrduShahmukhiNormalizer.numerals_to_persian)
         text = self.normalization.normalize_combine_characters(text)
 
         text = self.normalization.punctuations_space(text)
@@ -1401,32 +1649,41 @@ class UrduShahmukhiNormalizer(NormalizerI):
         return text
 
 class SindhiNormalizer(UrduShahmukhiNormalizer):
+
+    # Any intermediate do-chasmi, and any other do-chasmi ending except {گھ, جھ, ڙھ}.
+    # The final rule looks behind instead of consuming the previous character, which
+    # is either not a do-chasmi or one which the medial rule converts
+    _DO_CHASHMI_RE=re.compile(r"ھ\B|(?<=[^ڙجگ])ھ")
+
+    urdu_to_sindhi = str.maketrans({
+        'ی': 'ي',
+        'ے': 'ي',
+        'ہ': 'ه', # Urdu gol-he to Arabic choti-he
+        'ٹ': 'ٽ',
+        'ڈ': 'ڊ',
+        'ڑ': 'ڙ',
+        'ݙ': 'ڏ', # Saraiki implosive to Sindhi
+        # Below are ambiguous, uncomment for extreme cases
+        # 'ٹھ': 'ٺ',
+        # 'ڈھ': 'ڍ',
+        # 'ڑھ': 'ڙه',
+        # 'تھ': 'ٿ',
+        # 'دھ': 'ڌ',
+        # 'پھ': 'ڦ',
+        # 'بھ': 'ڀ',
+    })
+    _URDU_TO_SINDHI_PROBE = _init_translate_probe(urdu_to_sindhi)
+
     def __init__(self, lang='sd', remove_diacritics=True, do_normalize_numerals=False,convert_numerals_to_native=False):
         super().__init__(lang, remove_diacritics, do_normalize_numerals, convert_numerals_to_native)
-
-        self.urdu_to_sindhi = str.maketrans({
-            'ی': 'ي',
-            'ے': 'ي',
-            'ہ': 'ه', # Urdu gol-he to Arabic choti-he
-            'ٹ': 'ٽ',
-            'ڈ': 'ڊ',
-            'ڑ': 'ڙ',
-            'ݙ': 'ڏ', # Saraiki implosive to Sindhi
-            # Below are ambiguous, uncomment for extreme cases
-            # 'ٹھ': 'ٺ',
-            # 'ڈھ': 'ڍ',
-            # 'ڑھ': 'ڙه',
-            # 'تھ': 'ٿ',
-            # 'دھ': 'ڌ',
-            # 'پھ': 'ڦ',
-            # 'بھ': 'ڀ',
-        })
     
     def normalize(self, text):
         text = super().normalize(text)
-        text = re.sub(r"ھ\B", "ه", text) # Any intermediate do-chasmi can be converted to Arabic he
-        text = re.sub('([^ڙجگ])ھ', r'\1ه', text) # Except final {گھ, جھ, ڙھ}, all other do-chasmi endings can be converted to Arabic he
-        return text.translate(self.urdu_to_sindhi)
+        if 'ھ' in text:
+            text = SindhiNormalizer._DO_CHASHMI_RE.sub("ه", text) # can be converted to Arabic he
+        if SindhiNormalizer._URDU_TO_SINDHI_PROBE.search(text):
+            text = text.translate(self.urdu_to_sindhi)
+        return text
 
 
 class ArabicNormalizer(NormalizerI):
@@ -1435,6 +1692,8 @@ class ArabicNormalizer(NormalizerI):
     https://github.com/linuxscout/pyarabic/blob/master/doc/features.md
     '''
 
+    TATWEEL='\u0640'
+
     def __init__(self, lang='ar', remove_diacritics=True, do_normalize_numerals=False,convert_numerals_to_native=False):
         self.lang = lang
         self.remove_diacritic_marks = remove_diacritics
@@ -1451,7 +1710,8 @@ class ArabicNormalizer(NormalizerI):
             # text = self.normalizer.strip_harakat(text)
             # text = self.normalizer.strip_tashkeel(text)
             text = self.normalizer.strip_diacritics(text)
-        text = self.normalizer.strip_tatweel(text)
+        if ArabicNormalizer.TATWEEL in text:
+            text = self.normalizer.strip_tatweel(text)
         text = self.normalizer.normalize_ligature(text)
         if self.normalize_numerals:
             text = self.araby_trans.normalize_digits(text)
@@ -1497,7 +1757,18 @@ class EnglishNormalizer(NormalizerI):
     https://github.com/jfilter/clean-text/blob/90946c2cc8650929fe6487b70236b39348085fc8/cleantext/clean.py#L199
     '''
 
-    def __init__(self, lang, lowercase=False, ascii_only=True, fix_unicode=False, strip_lines=False, **kwargs):
+    # space between word and punctuation
+    _PUNCT_SPACE_RE=re.compile(r'\s([?.!"](?:\s|$))')
+    _ALNUM_RE=re.compile('[0-9a-zA-Z]')
+
+    def __init__(self, lang, lowercase=False, ascii_only=True, fix_unicode=False, strip_lines=False, 
+            clean_cache_size=0, **kwargs):
+        """
+        clean_cache_size: number of distinct cleaned lines to cache, off by default. 
+        Worth enabling for corpora that repeat many lines (titles, boilerplate); the cache 
+        keeps the input and output lines alive for as long as the normalizer lives. 
+        The options are fixed at construction, changing the attributes later has no effect.
+        """
         self.lang = lang
         self.lowercase = lowercase
         self.ascii = ascii_only
@@ -1510,20 +1781,51 @@ class EnglishNormalizer(NormalizerI):
         from unidecode import unidecode_expect_ascii
         cleantext.unidecode = unidecode_expect_ascii
 
-        self._normalize = cleantext.clean
+        clean = cleantext.clean
+        clean_kwargs = dict(lower=self.lowercase, to_ascii=self.ascii, fix_unicode=self.fix_unicode,
+                     strip_lines=self.strip_lines, **self.kwargs)
+        self._clean = lambda text: clean(text, **clean_kwargs)
+        # cleaning is the expensive step, so repeated lines can be served from a cache
+        if clean_cache_size:
+            self._clean = lru_cache(maxsize=clean_cache_size)(self._clean)
     
     def capitalize(self, text):
-        return re.sub('([0-9a-zA-Z])', lambda x: x.groups()[0].upper(), text, 1)
+        # uppercase the first ASCII alphanumeric character
+        match = EnglishNormalizer._ALNUM_RE.search(text)
+        if match is None:
+            return text
+        i = match.start()
+        return text[:i] + text[i].upper() + text[i+1:]
     
     def normalize(self, text):
         # Remove space between word and punctuation. https://stackoverflow.com/a/18878970
-        text = re.sub(r'\s([?.!"](?:\s|$))', r'\1', text)
+        text = EnglishNormalizer._PUNCT_SPACE_RE.sub(r'\1', text)
         # text = text.capitalize()
         text = self.capitalize(text)
-        return self._normalize(text, lower=self.lowercase, to_ascii=self.ascii, fix_unicode=self.fix_unicode,
-                     strip_lines=self.strip_lines, **self.kwargs)
-
-
+        return self._clean(text)
+
+
+
+# normalizer class for each supported language, other languages use BaseNormalizer
+_LANG_NORMALIZERS={
+    **dict.fromkeys(['hi','mr','kK','ne','sd_IN','awa','bho','mag','mai'],DevanagariNormalizer),
+    'sa': SanskritNormalizer,
+    'ks_IN': KashmiriDevanagariNormalizer,
+    **dict.fromkeys(['ur','pnb','skr','ks'],UrduShahmukhiNormalizer),
+    'sd': SindhiNormalizer,
+    'ar': ArabicNormalizer,
+    'fa': PersianNormalizer,
+    'pa': GurmukhiNormalizer,
+    'gu': GujaratiNormalizer,
+    **dict.fromkeys(['bn','as','bpy'],BengaliNormalizer),
+    'or': OriyaNormalizer,
+    'ml': MalayalamNormalizer,
+    'kn': KannadaNormalizer,
+    'ta': TamilNormalizer,
+    'te': TeluguNormalizer,
+    **dict.fromkeys(['si','pi_LK'],SinhalaNormalizer),
+    'en': EnglishNormalizer,
+}
 
 class IndicNormalizerFactory(object):
     """
@@ -1538,71 +1840,37 @@ class IndicNormalizerFactory(object):
             Paramters: 
             |language: language code
             |remove_nuktas: boolean, should the normalizer remove nukta characters 
+
+            Normalizers are cached, so calls with the same language and options 
+            return the same normalizer instance. The instance is shared by all 
+            these callers: changing its attributes affects every one of them. 
+            The caches it keeps (like the sanskrit `sandhi_cache`) are bounded, 
+            and at most 64 normalizers are kept alive by the factory. 
         """
         if language in langinfo.ISO639_v2_TO_v1:
             language = langinfo.ISO639_v2_TO_v1[language]
 
-        normalizer=None
-        if language in ['hi','mr','kK','ne','sd_IN','awa','bho','mag','mai']:
-            normalizer=DevanagariNormalizer(lang=language, **kwargs)
-        elif language in ['sa']:
-            normalizer=SanskritNormalizer(lang=language, **kwargs)
-        elif language in ['ks_IN']:
-            normalizer=KashmiriDevanagariNormalizer(lang=language, **kwargs)
-        elif language in ['ur','pnb','skr','ks']:
-            normalizer = UrduShahmukhiNormalizer(lang=language, **kwargs)
-        elif language in ['sd']:
-            normalizer = SindhiNormalizer(lang=language, **kwargs)
-        elif language in ['ar']:
-            normalizer = ArabicNormalizer(lang=language, **kwargs)
-        elif language in ['fa']:
-            normalizer = PersianNormalizer(lang=language, **kwargs)
-        elif language in ['pa']:
-            normalizer=GurmukhiNormalizer(lang=language, **kwargs)
-        elif language in ['gu']:
-            normalizer=GujaratiNormalizer(lang=language, **kwargs)
-        elif language in ['bn','as','bpy']:
-            normalizer=BengaliNormalizer(lang=language, **kwargs)
-        elif language in ['or']:
-            normalizer=OriyaNormalizer(lang=language, **kwargs)
-        elif language in ['ml']:
-            normalizer=MalayalamNormalizer(lang=language, **kwargs)
-        elif language in ['kn']:
-            normalizer=KannadaNormalizer(lang=language, **kwargs)
-        elif language in ['ta']:
-            normalizer=TamilNormalizer(lang=language, **kwargs)
-        elif language in ['te']:
-            normalizer=TeluguNormalizer(lang=language, **kwargs)
-        elif language in ['si','pi_LK']:
-            normalizer=SinhalaNormalizer(lang=language, **kwargs)
-        elif language in ['en']:
-            normalizer = EnglishNormalizer(lang=language, **kwargs)
-        else:    
-            normalizer=BaseNormalizer(lang=language, **kwargs)
-
-        return normalizer    
+        key=tuple(sorted(kwargs.items()))
+        try:
+            hash(key)
+        except TypeError:
+            # option values which are not hashable cannot be cached 
+            return self._create_normalizer(language,**kwargs)
+        return _get_cached_normalizer(language,key)
+
+    def _create_normalizer(self,language,**kwargs):
+        normalizer_class=_LANG_NORMALIZERS.get(language,BaseNormalizer)
+        return normalizer_class(lang=language, **kwargs)
 
     def is_language_supported(self,language): 
         """
         Is the language supported?
         """
-        if language in ['hi','mr','kK','ne','sd_IN','awa','bho','mag','mai',
-                        'sa','ks_IN',
-                        'pa',
-                        'gu',
-                        'bn','as','bpy',
-                        'or',
-                        'ml',
-                        'kn',
-                        'ta',
-                        'te',
-                        'si','pi_LK',
-                        'ur','pnb','sd','skr','ks',
-                        'ar','fa',
-                        'en']:
-            return True
-        else:
-            return False
+        return language in _LANG_NORMALIZERS
+
+@lru_cache(maxsize=64)
+def _get_cached_normalizer(language,kwargs_items):
+    return IndicNormalizerFactory()._create_normalizer(language,**dict(kwargs_items))
 
 
 if __name__ == '__main__': 
@@ -1626,9 +1894,8 @@ if __name__ == '__main__':
     # DO normalization 
     with codecs.open(sys.argv[1],'r','utf-8') as ifile:
         with codecs.open(sys.argv[2],'w','utf-8') as ofile:
-            for line in ifile.readlines():
-                normalized_line=normalizer.normalize(line)
-                ofile.write(normalized_line)
+            # stream the lines, large corpora need not fit in memory
+            ofile.writelines(map(normalizer.normalize,ifile))
    
     ## gather status about normalization 
     #with codecs.open(sys.argv[1],'r','utf-8') as ifile:
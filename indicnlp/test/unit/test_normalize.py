@@ -0,0 +1,16 @@
+import unittest
+
+from indicnlp.normalize.indic_normalize import MalayalamNormalizer
+
+class MalayalamNormalizerTest(unittest.TestCase):
+
+    def test_intermediate_virama_to_chillus(self):
+        normalizer=MalayalamNormalizer(do_convert_viramas_to_chillus=True)
+        # every virama-consonant followed by a Malayalam character is converted, 
+        # including repeated ones (ണ്ണ്ക -> ൺൺക)
+        self.assertEqual(normalizer.normalize('ണ്ണ്ക'),'ൺൺക')
+        # a final virama-consonant is not converted
+        self.assertEqual(normalizer.normalize('കണ്'),'കണ്')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,15 @@
+import unittest
+
+from indicnlp.tokenize.sentence_tokenize import sentence_split
+
+class SentenceSplitTest(unittest.TestCase):
+
+    def test_blank_lines(self):
+        # blank lines leave empty candidates after the newline split, these used to raise IndexError
+        self.assertEqual(sentence_split('a\n\nb','hi'),['a','b'])
+        self.assertEqual(sentence_split('ख\n\n  Mr.','hi'),['ख','  Mr.'])
+        # an empty line after a non-breaking phrase ends the merge without adding a space
+        self.assertEqual(sentence_split('"क ख.\n\nग"','hi'),['"क ख.','ग"'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -17,6 +17,8 @@ in many Indian languages.
 """
 
 import re
+from bisect import bisect_left
+from functools import lru_cache
 
 from indicnlp.transliterate import unicode_transliterate
 from indicnlp import langinfo
@@ -36,21 +38,34 @@ DELIM_PAT_URDU=re.compile(r'[۔؟!\?]')
 ## pattern to check for presence of danda in text 
 CONTAINS_DANDA=re.compile(r'[\u0964\u0965]')
 
-def is_acronym_abbvr(text,lang):
-    """Is the text a non-breaking phrase
+## pattern to locate double quotes
+DOUBLE_QUOTE=re.compile('"')
 
-    Args:
-        text (str): text to check for non-breaking phrase
-        lang (str): ISO 639-2 language code
+## languages which use DELIM_PAT_URDU
+PERSO_ARABIC_DELIM_LANGUAGES=frozenset(['ur','pnb','ks'])
 
-    Returns:
-        boolean: true if `text` is a non-breaking phrase
+@lru_cache(maxsize=None)
+def _auto_delim_pats(lang):
     """
+    Returns the delimiter pattern to use for `lang`, and the pattern to use instead if the
+    text contains a danda (None if danda is not a delimiter for `lang`)
+    """
+    if langinfo.is_danda_delim(lang):
+        return (DELIM_PAT_NO_DANDA,DELIM_PAT_DANDA)
+    elif lang in PERSO_ARABIC_DELIM_LANGUAGES:
+        return (DELIM_PAT_URDU,None)
+    else:
+        return (DELIM_PAT_NO_DANDA,None)
+
+@lru_cache(maxsize=64)
+def _is_period_delim(delim_pat):
+    """
+    Is period a delimiter for `delim_pat`? Patterns are compiled once, so the answer is cached per pattern
+    """
+    return delim_pat.search('.') is not None
 
-    if lang == 'en':
-        return is_en_acronym_abbvr(text)
-
-    ack_chars =  {
+## non-breaking phrases, in Devanagari
+ACK_CHARS = frozenset({
      ## acronym for latin characters
       'ए', 'ऎ',
       'बी', 'बि', 
@@ -163,21 +178,10 @@ def is_acronym_abbvr(text,lang):
      'कु',
      'चि',
      'सौ',
-    }
-
-    return unicode_transliterate.UnicodeIndicTransliterator.transliterate(text,lang,'hi') in ack_chars
-
-def is_en_acronym_abbvr(text):
-    """Is the English text a non-breaking phrase
-
-    Args:
-        text (str): English text to check for non-breaking phrase
+})
 
-    Returns:
-        boolean: true if `text` is a non-breaking phrase
-    """
-    
-    en_acr_chars = {
+## non-breaking phrases for English
+EN_ACR_CHARS = frozenset({
         
         # Latin letters used in acronyms
         'A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M',
@@ -194,9 +198,43 @@ def is_en_acronym_abbvr(text):
 
         # Currencies
         'Rs',
-    }
+})
+
+@lru_cache(maxsize=8192)
+def _to_devanagari(text,lang):
+    """
+    Transliterates `text` to Devanagari. Candidate words repeat a lot across documents 
+    (single letters, honorifics), so the result is cached.
+    """
+    return unicode_transliterate.UnicodeIndicTransliterator.transliterate(text,lang,'hi')
+
+def is_acronym_abbvr(text,lang):
+    """Is the text a non-breaking phrase
+
+    Args:
+        text (str): text to check for non-breaking phrase
+        lang (str): ISO 639-2 language code
+
+    Returns:
+        boolean: true if `text` is a non-breaking phrase
+    """
+
+    if lang == 'en':
+        return is_en_acronym_abbvr(text)
+
+    return _to_devanagari(text,lang) in ACK_CHARS
+
+def is_en_acronym_abbvr(text):
+    """Is the English text a non-breaking phrase
+
+    Args:
+        text (str): English text to check for non-breaking phrase
+
+    Returns:
+        boolean: true if `text` is a non-breaking phrase
+    """
     
-    return text in en_acr_chars
+    return text in EN_ACR_CHARS
 
 def sentence_split(text,lang,delim_pat='auto'): ## New signature
     """split the text into sentences
@@ -222,22 +260,12 @@ def sentence_split(text,lang,delim_pat='auto'): ## New signature
     
     #print('Input: {}'.format(delim_pat))
     if delim_pat=='auto':
-        if langinfo.is_danda_delim(lang):
-            # in modern texts it is possible that period is used as delimeter
-            # instead of DANDA. Hence, a check. Use danda delimiter pattern
-            # only if text contains at least one danda
-            if CONTAINS_DANDA.search(text) is None:
-                delim_pat=DELIM_PAT_NO_DANDA
-                #print('LANG has danda delim. TEXT_CONTAINS_DANDA: FALSE --> DELIM_PAT_NO_DANDA')
-            else:
-                delim_pat=DELIM_PAT_DANDA
-                #print('LANG has danda delim. TEXT_CONTAINS_DANDA: TRUE --> DELIM_PAT_DANDA')
-        else:
-            if lang in {'ur','pnb','ks'}:
-                delim_pat=DELIM_PAT_URDU
-            else:
-                delim_pat=DELIM_PAT_NO_DANDA
-            #print('LANG has no danda delim --> DELIM_PAT_NO_DANDA')
+        delim_pat,danda_delim_pat=_auto_delim_pats(lang)
+        # in modern texts it is possible that period is used as delimeter
+        # instead of DANDA. Hence, a check. Use danda delimiter pattern
+        # only if text contains at least one danda
+        if danda_delim_pat is not None and CONTAINS_DANDA.search(text) is not None:
+            delim_pat=danda_delim_pat
 
     ## otherwise, assume the caller set the delimiter pattern
     
@@ -246,10 +274,7 @@ def sentence_split(text,lang,delim_pat='auto'): ## New signature
     begin=0
     text = text.replace('\r', '').strip()
 
-    double_quotes_indices = []
-    for i, c in enumerate(text):
-        if c == '"':
-            double_quotes_indices.append(i)
+    double_quotes_indices = [mo.start() for mo in DOUBLE_QUOTE.finditer(text)]
     
     check_for_double_quotes = False # Double-quotes aware sentence splitting
     if double_quotes_indices:
@@ -268,7 +293,8 @@ def sentence_split(text,lang,delim_pat='auto'): ## New signature
         
         ## Leave sentences inside double quotes as it is
         if check_for_double_quotes:
-            is_quotes_open = sum([1 for i in double_quotes_indices if i < p1]) % 2
+            # number of quotes before the delimiter, the indices are sorted
+            is_quotes_open = bisect_left(double_quotes_indices, p1) % 2
             if is_quotes_open:
                 continue
 
@@ -282,15 +308,24 @@ def sentence_split(text,lang,delim_pat='auto'): ## New signature
     if len(s)>0: # Remaining chunk as new sentence
         cand_sentences.append(s)
     
+    # most candidates have no line breaks, only those are split
     cand_sentences_new = []
     for sentence in cand_sentences:
-        cand_sentences_new.extend(sentence.split('\n'))
+        if '\n' in sentence:
+            cand_sentences_new.extend(sentence.split('\n'))
+        else:
+            cand_sentences_new.append(sentence)
     cand_sentences = cand_sentences_new
 
-    if not delim_pat.search('.'):
+    if not _is_period_delim(delim_pat):
         ## run phase 2 only if delimiter pattern contains period
         #print('No need to run phase2')
         return cand_sentences
+
+    if not any(sentence.endswith('.') for sentence in cand_sentences):
+        ## phase 2 only merges around sentences ending with period, 
+        ## otherwise it just drops the empty lines
+        return [sentence for sentence in cand_sentences if sentence]
 #     print(cand_sentences)
 #     print('====')
         
@@ -304,19 +339,23 @@ def sentence_split(text,lang,delim_pat='auto'): ## New signature
     bad_state=False
 
     for i, sentence in enumerate(cand_sentences): 
-        words=sentence.split(' ')
+        # the last word starts after the last space, the sentence is a single word if there is none
+        last_space=sentence.rfind(' ')
+        ends_with_period=sentence.endswith('.')
         #if len(words)<=2 and words[-1]=='.':
-        if len(words)==1 and sentence[-1]=='.':
+        if last_space==-1 and ends_with_period:
             bad_state=True
             sen_buffer = sen_buffer + ' ' + sentence
         ## NEW condition    
-        elif sentence[-1]=='.' and is_acronym_abbvr(words[-1][:-1],lang):
+        elif ends_with_period and is_acronym_abbvr(sentence[last_space+1:-1],lang):
             if len(sen_buffer)>0 and  not bad_state:
                 final_sentences.append(sen_buffer)
             bad_state=True
             sen_buffer = sentence
         elif bad_state:
-            sen_buffer = sen_buffer + ' ' + sentence
+            ## an empty line ends the run without being merged into it
+            if sentence:
+                sen_buffer = sen_buffer + ' ' + sentence
             if len(sen_buffer)>0:
                 final_sentences.append(sen_buffer)
             sen_buffer=''
@@ -331,3 +370,16 @@ def sentence_split(text,lang,delim_pat='auto'): ## New signature
         final_sentences.append(sen_buffer)
     
     return final_sentences
+
+def sentence_split_batch(texts,lang,delim_pat='auto'):
+    """split each text in a batch into sentences
+
+    Args:
+        texts (list): texts to split into sentences
+        lang (str): ISO 639-2 language code
+        delim_pat (str): delimiter pattern, see `sentence_split`
+
+    Returns:
+        list: list of sentences identified from each of the input texts
+    """
+    return [sentence_split(text,lang,delim_pat) for text in texts]